@@ -0,0 +1 @@
+from services.ingest_worker.app.dedup_batcher import *  # noqa: F401,F403
@@ -0,0 +1 @@
+from services.ingest_worker.app.jsonl_writer import *  # noqa: F401,F403
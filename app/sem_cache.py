@@ -0,0 +1 @@
+from services.ingest_worker.app.sem_cache import *  # noqa: F401,F403
@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
 import argparse
-import json
+import io
 import os
+import re
 import shlex
 import subprocess
 import sys
 import tempfile
 from pathlib import Path
 
+import orjson
+
+# Flush the write buffer to the temp file every N lines
+_FLUSH_EVERY = 4096
+
+# Fast path: only objects that open with the "url" key skip the parse — the
+# shape our own writers emit. Anything else (url later in the object, nested
+# payloads, truncated lines) falls back to a real parse below, which both
+# finds a top-level url and rejects invalid JSON.
+URL_KEY = re.compile(rb'^\s*\{\s*"url"\s*:')
+
 
 def main() -> None:
     ap = argparse.ArgumentParser(description="Load buffered events JSONL into BigQuery events_raw")
@@ -15,12 +27,14 @@ def main() -> None:
     ns = ap.parse_args()
 
     env_file = Path(__file__).parent.parent / ".env"
-    if env_file.exists():
-        for line in env_file.read_text().splitlines():
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, _, value = line.partition("=")
-                os.environ.setdefault(key.strip(), value.strip())
+    # Only touch .env when the vars we need are not already configured
+    if ("GCP_PROJECT_ID" not in os.environ or "BQ_DATASET" not in os.environ) and env_file.exists():
+        with open(env_file) as fh:
+            for line in fh:
+                line = line.strip()
+                if line and not line.startswith("#") and "=" in line:
+                    key, _, value = line.partition("=")
+                    os.environ.setdefault(key.strip(), value.strip())
 
     dataset = os.environ.get("BQ_DATASET", "pradar")
     project = os.environ.get("GCP_PROJECT_ID")
@@ -30,31 +44,51 @@ def main() -> None:
 
     # Filter valid events (must have 'url' field)
     valid_count = 0
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as tmp:
-        tmp_path = tmp.name
-        with open(ns.buffer) as f:
+    skipped = 0
+    with tempfile.NamedTemporaryFile(mode="wb", suffix=".jsonl", delete=False) as raw_tmp:
+        tmp_path = raw_tmp.name
+        tmp = io.BufferedWriter(raw_tmp, buffer_size=1 << 20)
+        buf: list[bytes] = []
+        with open(ns.buffer, "rb") as f:
             for line in f:
-                try:
-                    obj = json.loads(line)
-                    if "url" in obj:
-                        tmp.write(line)
-                        valid_count += 1
-                except json.JSONDecodeError:
-                    continue
+                if not URL_KEY.search(line):
+                    try:
+                        obj = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        skipped += 1
+                        continue
+                    if "url" not in obj:
+                        skipped += 1
+                        continue
+                buf.append(line)
+                valid_count += 1
+                if len(buf) >= _FLUSH_EVERY:
+                    tmp.writelines(buf)
+                    buf.clear()
+        if buf:
+            tmp.writelines(buf)
+        tmp.flush()
 
     if valid_count == 0:
         print(f"No valid events found in {ns.buffer}", file=sys.stderr)
         os.unlink(tmp_path)
         sys.exit(0)
 
+    load_path = tmp_path
+    if skipped == 0:
+        # Buffer is already clean JSONL; load it directly and drop the copy
+        os.unlink(tmp_path)
+        load_path = ns.buffer
+
     table = f"{project}:{dataset}.events_raw"
-    cmd = ["bq", "load", "--source_format=NEWLINE_DELIMITED_JSON", table, tmp_path]
+    cmd = ["bq", "load", "--source_format=NEWLINE_DELIMITED_JSON", table, load_path]
     print("Running:", " ".join(shlex.quote(c) for c in cmd))
     try:
         subprocess.check_call(cmd)
         print(f"Loaded {valid_count} events into {table}")
     finally:
-        os.unlink(tmp_path)
+        if load_path == tmp_path:
+            os.unlink(tmp_path)
 
 
 if __name__ == "__main__":
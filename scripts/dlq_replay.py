@@ -3,33 +3,46 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
 import os
-from typing import Any
 
-from phishradar.services.ingest_worker.app.paths import BUFFER_DIR
-from phishradar.services.ingest_worker.app.qdrant_client import QdrantStore
+import aiofiles
+import orjson
+
+from services.ingest_worker.app.paths import BUFFER_DIR
+from services.ingest_worker.app.qdrant_client import QdrantStore
+
+# Max in-flight upserts while replaying
+REPLAY_CONCURRENCY = 32
 
 
 async def replay_qdrant_upsert(path: str) -> int:
     store = QdrantStore()
-    n = 0
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
+    sem = asyncio.Semaphore(REPLAY_CONCURRENCY)
+    counter = {"n": 0}
+
+    async def _one(url: str, vector: list, payload: dict) -> None:  # type: ignore[type-arg]
+        async with sem:
             try:
-                row = json.loads(line)
+                await store.upsert(url, vector, payload)
+                counter["n"] += 1
+            except Exception:
+                pass
+
+    async with asyncio.TaskGroup() as tg:
+        async with aiofiles.open(path, "rb") as f:
+            async for line in f:
+                try:
+                    row = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
                 payload = row.get("payload") or {}
                 url = payload.get("url") or (payload.get("payload") or {}).get("url")
-                vec_dim = int(payload.get("vector_dim") or 0)
                 # We cannot reconstruct vector from DLQ safely; skip if missing vector
                 vector = payload.get("vector") or []
                 if not url or not isinstance(vector, list) or not vector:
                     continue
-                await store.upsert(url, vector, payload.get("payload") or {})
-                n += 1
-            except Exception:
-                continue
-    return n
+                tg.create_task(_one(url, vector, payload.get("payload") or {}))
+    return counter["n"]
 
 
 async def main() -> None:
@@ -48,4 +61,3 @@ async def main() -> None:
 
 if __name__ == "__main__":
     asyncio.run(main())
-
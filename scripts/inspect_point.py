@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import uuid
 from qdrant_client import QdrantClient
 
@@ -13,7 +14,8 @@ def main() -> None:
     ap.add_argument("--collection", default="phishradar_urls")
     ns = ap.parse_args()
     pid = str(uuid.uuid5(uuid.NAMESPACE_URL, ns.url))
-    cli = QdrantClient(url=ns.qurl)
+    # gRPC skips HTTP/JSON encoding of the vector payload
+    cli = QdrantClient(url=ns.qurl, prefer_grpc=True, grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")))
     res = cli.retrieve(collection_name=ns.collection, ids=[pid], with_payload=True, with_vectors=False)
     for r in res:
         print({"id": str(r.id), "payload": r.payload})
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import argparse
+import os
 
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as qm
@@ -7,12 +8,13 @@ from qdrant_client.http import models as qm
 
 def main() -> None:
     ap = argparse.ArgumentParser()
-    ap.add_argument("action", choices=["recreate", "drop", "info"])  # noqa: ARG002
+    ap.add_argument("action", choices=["recreate", "drop", "info", "finalize-bulk"])  # noqa: ARG002
     ap.add_argument("--url", default="http://localhost:6333")
     ap.add_argument("--collection", default="phishradar_urls")
     ap.add_argument("--size", type=int, default=1024)
     ns = ap.parse_args()
-    cli = QdrantClient(url=ns.url)
+    # gRPC skips HTTP/JSON encoding of the vector payload
+    cli = QdrantClient(url=ns.url, prefer_grpc=True, grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")))
     if ns.action == "recreate":
         cli.recreate_collection(
             collection_name=ns.collection,
@@ -22,6 +24,13 @@ def main() -> None:
     elif ns.action == "drop":
         cli.delete_collection(ns.collection)
         print("dropped")
+    elif ns.action == "finalize-bulk":
+        # Re-enable HNSW indexing after a QDRANT_BULK_LOAD backfill
+        cli.update_collection(
+            collection_name=ns.collection,
+            optimizer_config=qm.OptimizersConfigDiff(indexing_threshold=20_000),
+        )
+        print("indexing re-enabled")
     else:
         print(cli.get_collection(ns.collection))
 
@@ -5,6 +5,7 @@ import argparse
 import asyncio
 import time
 from dataclasses import dataclass
+from itertools import islice
 import os
 from typing import Iterable
 from urllib.parse import urlparse
@@ -29,6 +30,14 @@ class SeedStats:
     failed: int = 0
 
 
+def _feed_client() -> httpx.AsyncClient:
+    """Client for the public feed endpoints; HTTP/2 when the h2 extra is present."""
+    try:
+        return httpx.AsyncClient(http2=True, timeout=30.0)
+    except ImportError:
+        return httpx.AsyncClient(timeout=30.0)
+
+
 def _domain(url: str) -> str:
     try:
         return urlparse(url).netloc
@@ -93,45 +102,75 @@ async def fetch_sinkingyachts(limit: int, client: httpx.AsyncClient) -> list[str
         return []
 
 
-async def seed(urls: Iterable[str], api_base: str, concurrency: int) -> SeedStats:
-    stats = SeedStats(total=0)
+def _batches(urls: Iterable[str], size: int) -> Iterable[list[str]]:
+    it = iter(urls)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+async def seed(
+    urls: Iterable[str], api_base: str, concurrency: int, batch_size: int = 32
+) -> SeedStats:
     sem = asyncio.Semaphore(concurrency)
 
-    async def process(u: str) -> None:
-        nonlocal stats
+    async def process(client: httpx.AsyncClient, batch: list[str]) -> SeedStats:
+        # Each worker reports a local SeedStats; no shared-state writes needed
         async with sem:
-            stats.total += 1
-            dom = _domain(u)
-            title = dom
+            doms = [_domain(u) for u in batch]
             try:
-                async with httpx.AsyncClient(timeout=20.0) as client:
-                    t0 = time.perf_counter()
-                    er = await client.post(
-                        f"{api_base}/embed",
-                        json={"url": u, "title": title, "domain": dom},
-                    )
-                    er.raise_for_status()
-                    e = er.json()
-                    stats.embedded += 1
-                    vec = e["vector"]
-                    dr = await client.post(
-                        f"{api_base}/dedup",
-                        json={
-                            "url": u,
-                            "vector": vec,
-                            "payload": {"domain": dom, "title": title, "ts": int(time.time())},
-                        },
-                    )
-                    dr.raise_for_status()
-                    d = dr.json()
-                    if d.get("is_duplicate"):
-                        stats.duplicates += 1
-                    else:
-                        stats.new += 1
+                er = await client.post(
+                    f"{api_base}/embed_batch",
+                    json={
+                        "items": [
+                            {"url": u, "title": d, "domain": d} for u, d in zip(batch, doms)
+                        ]
+                    },
+                )
+                er.raise_for_status()
+                vectors = er.json()["vectors"]
+                now = int(time.time())
+                dr = await client.post(
+                    f"{api_base}/dedup_batch",
+                    json={
+                        "items": [
+                            {
+                                "url": u,
+                                "vector": v,
+                                "payload": {"domain": d, "title": d, "ts": now},
+                            }
+                            for u, v, d in zip(batch, vectors, doms)
+                        ]
+                    },
+                )
+                dr.raise_for_status()
+                results = dr.json()
+                dups = sum(1 for d in results if d.get("is_duplicate"))
+                return SeedStats(
+                    total=len(batch),
+                    embedded=len(vectors),
+                    new=len(results) - dups,
+                    duplicates=dups,
+                )
             except Exception:
-                stats.failed += 1
+                return SeedStats(total=len(batch), failed=len(batch))
 
-    await asyncio.gather(*(process(u) for u in urls))
+    # One shared client: reuses the connection pool across all batches instead
+    # of paying a TCP/TLS handshake per URL.
+    limits = httpx.Limits(
+        max_connections=concurrency * 2, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(timeout=60.0, limits=limits) as client:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(process(client, b)) for b in _batches(urls, batch_size)]
+
+    stats = SeedStats()
+    for t in tasks:
+        part = t.result()
+        stats.total += part.total
+        stats.embedded += part.embedded
+        stats.new += part.new
+        stats.duplicates += part.duplicates
+        stats.failed += part.failed
     return stats
 
 
@@ -146,29 +185,21 @@ async def main() -> None:
     ap.add_argument("--collection", default=os.getenv("QDRANT_COLLECTION", "phishradar_urls"), help="Qdrant collection name")
     ns = ap.parse_args()
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        src1 = await fetch_openphish(ns.limit, client)
-        src2 = await fetch_phishtank(ns.limit, client, ns.phishtank)
-        src3 = await fetch_sinkingyachts(ns.limit, client)
-    # De-duplicate and basic sanity
-    urls = []
-    seen: set[str] = set()
-    for u in src1 + src2 + src3:
-        if not u or u in seen:
-            continue
-        seen.add(u)
-        urls.append(u)
+    async with _feed_client() as client:
+        # The three feeds are independent; fetch them concurrently
+        async with asyncio.TaskGroup() as tg:
+            t1 = tg.create_task(fetch_openphish(ns.limit, client))
+            t2 = tg.create_task(fetch_phishtank(ns.limit, client, ns.phishtank))
+            t3 = tg.create_task(fetch_sinkingyachts(ns.limit, client))
+        src1, src2, src3 = t1.result(), t2.result(), t3.result()
+    # De-duplicate preserving first-seen order
+    urls = list(dict.fromkeys(u for u in (*src1, *src2, *src3) if u))
 
     # Fallback to local file if nothing fetched
     if not urls:
         try:
             with open(ns.file, "r", encoding="utf-8") as fh:
-                for line in fh:
-                    u = line.strip()
-                    if not u or u in seen:
-                        continue
-                    seen.add(u)
-                    urls.append(u)
+                urls = list(dict.fromkeys(u for u in (line.strip() for line in fh) if u))
         except Exception:
             pass
 
@@ -180,20 +211,31 @@ async def main() -> None:
             dim = int(len(probe.json().get("vector") or []))
         except Exception:
             dim = 0
-        if dim > 0:
-            # Create collection if missing or mismatched
+    if dim > 0:
+
+        def _ensure_collection() -> None:
+            # One gRPC round-trip to list collections; create lazily if missing
+            from qdrant_client import QdrantClient
+            from qdrant_client.http import models as qm
+
+            cli = QdrantClient(
+                url=ns.qurl,
+                prefer_grpc=True,
+                grpc_port=int(os.getenv("QDRANT_GRPC_PORT", "6334")),
+            )
             try:
-                r = await client.get(f"{ns.qurl}/collections/{ns.collection}")
-                if r.status_code != 200 or int((r.json().get("result", {}).get("config", {}).get("params", {}).get("vectors", {}).get("size", 0))) != dim:
-                    await client.put(
-                        f"{ns.qurl}/collections/{ns.collection}",
-                        headers={"content-type": "application/json"},
-                        json={"vectors": {"size": dim, "distance": "Cosine"}},
+                names = {c.name for c in cli.get_collections().collections}
+                if ns.collection not in names:
+                    cli.recreate_collection(
+                        collection_name=ns.collection,
+                        vectors_config=qm.VectorParams(size=dim, distance=qm.Distance.COSINE),
                     )
             except Exception:
-                # Best-effort; continue
+                # Best-effort; the worker ensures the collection at startup too
                 pass
 
+        await asyncio.to_thread(_ensure_collection)
+
     print(f"Collected {len(urls)} URLs; seeding via {ns.api}")
     stats = await seed(urls, ns.api, ns.concurrency)
     print(
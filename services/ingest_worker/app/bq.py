@@ -1,33 +1,66 @@
 from __future__ import annotations
 
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterator
 
 from anyio import to_thread
 
 from .config import settings
 from .logging_metrics import bq_writes_total, bq_failures_total, bq_latency_seconds
-from .dlq import write_dlq
+from .dlq import write_dlq_many
 
 
 def _enabled() -> bool:
     return (settings.google_app_credentials or "") != "" and (settings.gcp_project_id or "") != ""
 
 
+def _chunks(rows: list[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    it = iter(rows)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+@lru_cache(maxsize=1)
+def _bq_client() -> Any:
+    """Cached BigQuery client; construction does credential/channel setup."""
+    from google.cloud import bigquery  # type: ignore
+
+    return bigquery.Client(project=settings.gcp_project_id)
+
+
 def _insert_rows_sync(table: str, rows: list[dict[str, Any]]) -> None:
-    """Synchronous BigQuery insert - should only be called from thread pool."""
+    """Synchronous BigQuery insert - should only be called from thread pool.
+
+    Rows are sent in chunks of `BQ_BATCH_ROWS` (default 500) so a large burst
+    never goes out as one oversized request hitting the streaming row cap.
+    """
     if not _enabled():
         raise RuntimeError("bq_disabled")
     try:
-        from google.cloud import bigquery  # type: ignore
+        client = _bq_client()
     except Exception as e:  # pragma: no cover
         raise RuntimeError("bq_client_missing") from e
-    client = bigquery.Client(project=settings.gcp_project_id)
     dataset = settings.bq_dataset
     table_id = f"{client.project}.{dataset}.{table}"
-    errors = client.insert_rows_json(table_id, rows)
-    if errors:  # pragma: no cover
-        raise RuntimeError(str(errors))
+    chunks = list(_chunks(rows, max(1, settings.bq_batch_rows)))
+    streams = max(1, settings.bq_write_streams)
+    if len(chunks) <= 1 or streams == 1:
+        for chunk in chunks:
+            errors = client.insert_rows_json(table_id, chunk)
+            if errors:  # pragma: no cover
+                raise RuntimeError(str(errors))
+        return
+    # Shard chunks across parallel insert requests (one per "stream") so large
+    # batches are not serialized through a single HTTP round-trip.
+    with ThreadPoolExecutor(max_workers=min(streams, len(chunks))) as pool:
+        futures = [pool.submit(client.insert_rows_json, table_id, chunk) for chunk in chunks]
+        for fut in futures:
+            errors = fut.result()
+            if errors:  # pragma: no cover
+                raise RuntimeError(str(errors))
 
 
 async def write_events(rows: list[dict[str, Any]]) -> None:
@@ -40,8 +73,7 @@ async def write_events(rows: list[dict[str, Any]]) -> None:
         await to_thread.run_sync(_insert_rows_sync, table, rows)
     except Exception as e:
         bq_failures_total.labels(table=table).inc()
-        for r in rows:
-            write_dlq("bq_write_events", r, str(e))
+        write_dlq_many("bq_write_events", rows, str(e))
         raise
     finally:
         bq_latency_seconds.labels(table=table).observe(time.perf_counter() - t0)
@@ -57,8 +89,7 @@ async def write_receipts(rows: list[dict[str, Any]]) -> None:
         await to_thread.run_sync(_insert_rows_sync, table, rows)
     except Exception as e:
         bq_failures_total.labels(table=table).inc()
-        for r in rows:
-            write_dlq("bq_write_receipts", r, str(e))
+        write_dlq_many("bq_write_receipts", rows, str(e))
         raise
     finally:
         bq_latency_seconds.labels(table=table).observe(time.perf_counter() - t0)
@@ -4,8 +4,11 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
+    # Slotted so hot-path attribute reads are fixed-offset loads instead of
+    # __dict__ lookups. Not frozen: tests override fields on the shared
+    # instance (e.g. slack_signing_secret) via monkeypatch/assignment.
     api_host: str = os.getenv("API_HOST", "0.0.0.0")
     api_port: int = int(os.getenv("API_PORT", "8000"))
     env: str = os.getenv("ENV", "dev")
@@ -15,17 +18,43 @@ class Settings:
     embed_provider: str = os.getenv("EMBED_PROVIDER", "ollama")
     embed_model_name: str = os.getenv("EMBED_MODEL_NAME", "embeddinggemma:latest")
     ollama_base_url: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    # -1 pins the model in memory; accepts Ollama durations like "10m" too
+    ollama_keep_alive: str = os.getenv("OLLAMA_KEEP_ALIVE", "-1")
     remote_embed_api_key: str | None = os.getenv("REMOTE_EMBED_API_KEY")
 
     # Qdrant
     qdrant_url: str = os.getenv("QDRANT_URL", "http://localhost:6333")
     qdrant_collection: str = os.getenv("QDRANT_COLLECTION", "phishradar_urls")
     qdrant_rps: int = int(os.getenv("QDRANT_RPS", "10"))
+    # gRPC keeps one persistent channel (no per-request HTTP overhead);
+    # requires Qdrant's 6334 port to be reachable
+    qdrant_prefer_grpc: bool = (
+        os.getenv("QDRANT_PREFER_GRPC", "true").strip().lower() in ("1", "true", "yes")
+    )
+    qdrant_grpc_port: int = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
     qdrant_timeout: float = float(os.getenv("QDRANT_TIMEOUT", "5"))
+    # Overall wall-clock budget per store call, across all retry attempts
+    qdrant_total_deadline: float = float(os.getenv("QDRANT_TOTAL_DEADLINE", "30"))
+    # Upsert coalescing: flush when this many points are queued or the
+    # window elapses, whichever comes first
+    qdrant_batch_size: int = int(os.getenv("QDRANT_BATCH_SIZE", "128"))
+    qdrant_flush_ms: float = float(os.getenv("QDRANT_FLUSH_MS", "20"))
+    # Circuit breaker: after this many consecutive failures calls fail fast
+    # (no retries) until the cooldown elapses
+    qdrant_cb_failures: int = int(os.getenv("QDRANT_CB_FAILURES", "5"))
+    qdrant_cb_cooldown: float = float(os.getenv("QDRANT_CB_COOLDOWN", "10"))
+    # Bulk-load mode: create the collection with indexing disabled so a
+    # backfill skips per-upsert HNSW maintenance; finalize_bulk() re-enables
+    qdrant_bulk_load: bool = (
+        os.getenv("QDRANT_BULK_LOAD", "").strip().lower() in ("1", "true", "yes")
+    )
 
     # Redis
     redis_url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
+    # Ingest queue backend: "redis", "file", or "auto" (redis with file fallback)
+    ingest_backend: str = os.getenv("INGEST_BACKEND", "auto")
+
     # Slack
     slack_bot_token: str = os.getenv("SLACK_BOT_TOKEN", "")
     slack_signing_secret: str = os.getenv("SLACK_SIGNING_SECRET", "")
@@ -37,6 +66,8 @@ class Settings:
     gcp_project_id: str = os.getenv("GCP_PROJECT_ID", "")
     bq_dataset: str = os.getenv("BQ_DATASET", "pradar")
     google_app_credentials: str | None = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    bq_batch_rows: int = int(os.getenv("BQ_BATCH_ROWS", "500"))
+    bq_write_streams: int = int(os.getenv("BQ_WRITE_STREAMS", "4"))
 
     # Dedup/limits
     # Legacy threshold kept for backward-compat (interpreted as margin from 1.0)
@@ -63,6 +94,8 @@ class Settings:
 
     # Observability
     otel_exporter_otlp_endpoint: str | None = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+    # Correlation ids are opaque tags; sha256 only if a crypto hash is mandated
+    strict_cid: bool = os.getenv("STRICT_CID", "").strip().lower() in ("1", "true", "yes")
     prometheus_port: int = int(os.getenv("PROMETHEUS_PORT", "9000"))
 
     # Retry/backoff defaults
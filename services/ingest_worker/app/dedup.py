@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -11,6 +12,31 @@ from .domain import canonical_domain
 
 logger = logging.getLogger(__name__)
 
+# Similarity floors resolved once at import; settings are env-driven and static
+_SAME_DOM_FLOOR = float(settings.dedup_same_domain_min_sim)
+_GLOBAL_FLOOR = float(settings.dedup_global_min_sim)
+
+
+def refresh_thresholds() -> None:
+    """Re-resolve the similarity floors from settings (for config reloads/tests)."""
+    global _SAME_DOM_FLOOR, _GLOBAL_FLOOR
+    _SAME_DOM_FLOOR = float(settings.dedup_same_domain_min_sim)
+    _GLOBAL_FLOOR = float(settings.dedup_global_min_sim)
+
+_store: QdrantStore | None = None
+
+
+async def _no_hits() -> list[tuple[str, float, dict[str, Any]]]:
+    return []
+
+
+def _get_store() -> QdrantStore:
+    """Return a cached QdrantStore; constructing one per call re-did client setup."""
+    global _store
+    if _store is None:
+        _store = QdrantStore()
+    return _store
+
 
 def is_duplicate(similarity: float, *, same_domain: bool) -> bool:
     """Decide duplicate based on similarity floors.
@@ -18,32 +44,101 @@ def is_duplicate(similarity: float, *, same_domain: bool) -> bool:
     - If the nearest neighbor is from the same domain, use a lower threshold.
     - For cross-domain duplicates, require a stricter (higher) similarity.
     """
-    same_dom_floor = float(getattr(settings, "dedup_same_domain_min_sim", 0.94))
-    global_floor = float(getattr(settings, "dedup_global_min_sim", 0.985))
-    floor = same_dom_floor if same_domain else global_floor
-    return similarity >= floor
+    return similarity >= (_SAME_DOM_FLOOR if same_domain else _GLOBAL_FLOOR)
+
+
+def _decide(
+    domain: str,
+    best: tuple[str, float, dict[str, Any]] | None,
+) -> tuple[bool, float]:
+    max_sim = best[1] if best else 0.0
+    nn_domain = (best[2].get("domain") if best else None) or ""
+    same_dom = bool(domain and nn_domain and str(domain) == str(nn_domain)) if best else False
+    return is_duplicate(max_sim, same_domain=same_dom), max_sim
+
+
+async def upsert_and_check_many(
+    items: list[tuple[str, list[float], dict[str, Any]]]
+) -> list[tuple[bool, float, str | None]]:
+    """Batched variant of upsert_and_check: one search RPC for the whole batch.
+
+    For each item both the same-domain and global searches are folded into a
+    single `search_batch` call (two requests per item), then points are
+    upserted per item as in the single-URL path.
+    """
+    store = _get_store()
+    domains = [canonical_domain(url) for url, _, _ in items]
+    vectors: list[list[float]] = []
+    filters: list[Any] = []
+    for (_, vector, _), domain in zip(items, domains):
+        vectors.append(vector)
+        filters.append(store.domain_filter(domain) if domain else None)
+        vectors.append(vector)
+        filters.append(None)
+
+    try:
+        hit_lists = await store.search_batch(vectors, top_k=5, filters=filters)
+    except (UnexpectedResponse, ResponseHandlingException) as e:
+        logger.error(f"Qdrant batch search failed: {e}")
+        hit_lists = [[] for _ in vectors]
+    except Exception as e:
+        logger.exception(f"Unexpected error during batch dedup search: {e}")
+        raise
+
+    decisions: list[tuple[bool, float]] = []
+    to_upsert: list[tuple[str, list[float], dict[str, Any]]] = []
+    for i, ((url, vector, payload), domain) in enumerate(zip(items, domains)):
+        candidates = hit_lists[2 * i] + hit_lists[2 * i + 1]
+        best = max(candidates, key=lambda t: t[1], default=None)
+        decisions.append(_decide(domain, best))
+        clean_payload = dict(payload) if isinstance(payload, dict) else {}
+        clean_payload["domain"] = domain
+        to_upsert.append((url, vector, clean_payload))
+
+    # Persist the whole batch in one upsert call
+    try:
+        qids = await store.upsert_many(to_upsert)
+    except (UnexpectedResponse, ResponseHandlingException) as e:
+        logger.error(f"Qdrant batch upsert failed: {e}")
+        raise
+
+    return [
+        (dup, max_sim, qid if dup else None)
+        for (dup, max_sim), qid in zip(decisions, qids)
+    ]
 
 
 async def upsert_and_check(
     url: str, vector: list[float], payload: dict[str, Any]
 ) -> tuple[bool, float, str | None]:
-    store = QdrantStore()
+    store = _get_store()
     # Always derive canonical domain from the URL; do not trust incoming payload
     domain = canonical_domain(url)
     best: tuple[str, float, dict[str, Any]] | None = None
-    
+
     try:
-        # Prefer same-domain neighbors
-        hits_same = await store.search_same_domain(vector, str(domain), top_k=5) if domain else []
-        hits_all = []
-        if not hits_same:
-            hits_all = await store.search(vector, top_k=5)
-
-        # Choose best by similarity across the candidate lists
-        for src in (hits_same, hits_all):
-            for pid, sim, pl in src:
-                if best is None or sim > best[1]:
-                    best = (pid, sim, pl)
+        if hasattr(store, "search_batch"):
+            # Fold the same-domain and global searches into one RPC
+            filters = [store.domain_filter(str(domain)) if domain else None, None]
+            hit_lists = await store.search_batch([vector, vector], top_k=5, filters=filters)
+            candidates = [hit for hits in hit_lists for hit in hits]
+        else:
+            # Narrow store interface (e.g. test stubs): two independent searches
+            results = await asyncio.gather(
+                store.search_same_domain(vector, str(domain), top_k=5) if domain else _no_hits(),
+                store.search(vector, top_k=5),
+                return_exceptions=True,
+            )
+            candidates = []
+            for res in results:
+                if isinstance(res, (UnexpectedResponse, ResponseHandlingException)):
+                    # Continue with the other branch - missing hits just mean non-duplicate
+                    logger.error(f"Qdrant search failed for URL {url}: {res}")
+                    continue
+                if isinstance(res, BaseException):
+                    raise res
+                candidates.extend(res)
+        best = max(candidates, key=lambda t: t[1], default=None)
     except (UnexpectedResponse, ResponseHandlingException) as e:
         logger.error(f"Qdrant search failed for URL {url}: {e}")
         # Continue with empty results - will treat as non-duplicate
@@ -52,11 +147,8 @@ async def upsert_and_check(
         logger.exception(f"Unexpected error during dedup search for URL {url}: {e}")
         raise
 
-    max_sim = best[1] if best else 0.0
-    nn_domain = (best[2].get("domain") if best else None) or ""
-    same_dom = bool(domain and nn_domain and str(domain) == str(nn_domain)) if best else False
     # Cross-domain duplicates can be disabled via config by setting a very high global floor
-    dup = is_duplicate(max_sim, same_domain=same_dom)
+    dup, max_sim = _decide(domain, best)
     # Ensure stored payload contains the derived canonical domain
     clean_payload = dict(payload) if isinstance(payload, dict) else {}
     clean_payload["domain"] = domain
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from .dedup import upsert_and_check, upsert_and_check_many
+
+
+class DedupBatcher:
+    """Coalesce concurrent dedup requests into shared Qdrant round-trips.
+
+    Requests arriving within `max_wait_ms` of each other share one
+    `search_batch` and one batched upsert (via `upsert_and_check_many`);
+    each caller awaits its own future, so the public API is unchanged.
+    With the dispatcher not running (tests, scripts), submit() degrades
+    to the direct single-item path.
+    """
+
+    def __init__(self, max_batch: int = 64, max_wait_ms: float = 20.0) -> None:
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue[
+            tuple[tuple[str, Any, dict[str, Any]], asyncio.Future]
+        ] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="dedup-batcher")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(
+        self, url: str, vector: Any, payload: dict[str, Any]
+    ) -> tuple[bool, float, str | None]:
+        if self._task is None or self._task.done():
+            return await upsert_and_check(url, vector, payload)
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((url, vector, payload), fut))
+        return await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # Block for the first item, then fill the batch for up to max_wait
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                results = await upsert_and_check_many([item for item, _ in batch])
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            for (_, fut), res in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(res)
+
+
+# Shared instance; started/stopped from the app lifespan
+dedup_batcher = DedupBatcher()
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+
 from .paths import BUFFER_DIR
 
 
@@ -12,20 +13,26 @@ def _ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
-def write_dlq(op: str, payload: dict[str, Any], reason: str) -> None:
-    """Append a DLQ entry for failed side-effects.
+def write_dlq_many(op: str, payloads: list[dict[str, Any]], reason: str) -> None:
+    """Append DLQ entries for failed side-effects in one file open/write.
 
-    Structure: {op, payload, reason, ts}
+    Structure per line: {op, payload, reason, ts}
     """
+    if not payloads:
+        return
     dlq_dir = os.path.join(BUFFER_DIR, "dlq")
     _ensure_dir(dlq_dir)
-    line = {
-        "op": op,
-        "payload": payload,
-        "reason": reason,
-        "ts": datetime.now(timezone.utc).isoformat(),
-    }
+    ts = datetime.now(timezone.utc).isoformat()
     path = os.path.join(dlq_dir, f"{op}.jsonl")
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(line, ensure_ascii=False) + "\n")
+    lines = [
+        orjson.dumps({"op": op, "payload": p, "reason": reason, "ts": ts}) + b"\n"
+        for p in payloads
+    ]
+    with open(path, "ab") as f:
+        f.writelines(lines)
+
+
+def write_dlq(op: str, payload: dict[str, Any], reason: str) -> None:
+    """Append a single DLQ entry (thin wrapper over the batch writer)."""
+    write_dlq_many(op, [payload], reason)
 
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from urllib.parse import urlparse
 
 
+def _slow_path(url: str) -> str:
+    try:
+        return urlparse(url).hostname or ""
+    except Exception:
+        return ""
+
+
+@lru_cache(maxsize=8192)
 def canonical_domain(url: str) -> str:
     """Return a simple canonical domain for grouping duplicates.
 
@@ -12,13 +21,41 @@ def canonical_domain(url: str) -> str:
     This is a pragmatic approach matching the current product expectation
     (same host == candidate for duplication). For stricter grouping (eTLD+1),
     switch to a PSL-based extractor in a future hardening ticket.
+
+    Hand-rolled hostname extraction on the fast path: urlparse builds a full
+    ParseResult per call and this runs once per URL on every feed poll.
+    urlparse remains the fallback for scheme-less or unusual inputs
+    (IPv6 literals, whitespace) so edge-case behavior is unchanged.
+
+    Memoized: the same URL typically passes through here more than once per
+    cycle (embed, then dedup, then enqueue), and feed URLs repeat across
+    polls.
+
+    Deliberately kept pure Python: the worker ships as source via
+    requirements.txt with no extension build step, and find/slice on str
+    already lands in the single-digit-microsecond range per URL. Revisit
+    mypyc only if profiling ever shows this in the top frames again.
     """
-    try:
-        host = urlparse(url).hostname or ""
-    except Exception:
-        host = ""
+    i = url.find("://")
+    if i < 0:
+        host = _slow_path(url)
+    else:
+        s = url[i + 3 :]
+        for sep in ("/", "?", "#"):
+            j = s.find(sep)
+            if j >= 0:
+                s = s[:j]
+        at = s.rfind("@")
+        if at >= 0:
+            s = s[at + 1 :]
+        if "[" in s or " " in s:
+            host = _slow_path(url)
+        else:
+            p = s.rfind(":")
+            if p >= 0:
+                s = s[:p]
+            host = s
     host = host.lower()
     if host.startswith("www."):
         host = host[4:]
     return host
-
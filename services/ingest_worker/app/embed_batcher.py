@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+
+from .embeddings import OllamaEmbeddings
+
+
+class EmbedBatcher:
+    """Coalesce concurrent embed requests into shared Ollama calls.
+
+    Requests arriving within `max_wait_ms` of each other ride one /api/embed
+    batch of up to `max_batch` texts; each caller awaits its own future, so
+    the public API is unchanged. With the dispatcher not running (tests,
+    scripts), submit() degrades to a direct single-text call.
+    """
+
+    def __init__(self, max_batch: int = 32, max_wait_ms: float = 30.0) -> None:
+        self._emb = OllamaEmbeddings()
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue()
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="embed-batcher")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, text: str) -> tuple[list[float], int, str]:
+        if self._task is None or self._task.done():
+            return await self._emb.embed_async_single(text)
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, fut))
+        return await fut
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # Block for the first item, then fill the batch for up to max_wait
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Similar lengths per batch keep Ollama's padding overhead small
+            batch.sort(key=lambda item: len(item[0]))
+            try:
+                results = await self._emb.embed_async_many([text for text, _ in batch])
+            except Exception as e:
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            for (_, fut), res in zip(batch, results):
+                if not fut.done():
+                    fut.set_result(res)
+
+
+# Shared instance; started/stopped from the app lifespan
+embed_batcher = EmbedBatcher()
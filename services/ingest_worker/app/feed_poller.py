@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import orjson
 from cachetools import TTLCache
 
 try:
@@ -16,21 +17,64 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     aioredis = None  # type: ignore
 
+try:
+    # SIMD-accelerated hash; ~5-10x faster than SHA1 for these non-crypto keys
+    from blake3 import blake3  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    blake3 = None  # type: ignore
+
 from .config import settings
 from .domain import canonical_domain
-from .ingest_queue import IngestQueue
+from .ingest_queue import make_queue
 
 
-def _sha1(s: str) -> str:
+def _url_digest(s: str) -> str:
+    if blake3 is not None:
+        return blake3(s.encode("utf-8")).hexdigest(length=16)
     return hashlib.sha1(s.encode("utf-8")).hexdigest()
 
 
+class _BloomFilter:
+    """Small double-hashing Bloom filter (~128 KB at the default 1M bits).
+
+    Tracks URL digests this process has already seen so steady-state polls,
+    where most URLs repeat, skip the Redis round-trip entirely. False
+    positives drop a genuinely new URL; at 1M bits / 7 hashes the rate stays
+    well under 0.1% for the ~100k URLs a poll cycle can carry. Bits are
+    never cleared individually — SeenCache rotates whole filters to age
+    entries out.
+    """
+
+    def __init__(self, bits: int = 1 << 20, hashes: int = 7, buf: bytearray | None = None) -> None:
+        self._bits = bits
+        self._hashes = hashes
+        self._buf = buf if buf is not None else bytearray(bits // 8)
+
+    def _indexes(self, digest: str):
+        h = int(digest[:24], 16)
+        h1 = h & 0xFFFFFFFF
+        h2 = (h >> 32) | 1
+        for i in range(self._hashes):
+            yield (h1 + i * h2) % self._bits
+
+    def __contains__(self, digest: str) -> bool:
+        return all(self._buf[i >> 3] & (1 << (i & 7)) for i in self._indexes(digest))
+
+    def add(self, digest: str) -> None:
+        for i in self._indexes(digest):
+            self._buf[i >> 3] |= 1 << (i & 7)
+
+
 @dataclass
 class FeedItem:
     url: str
     source: str
 
 
+async def _empty() -> list[FeedItem]:
+    return []
+
+
 class SeenCache:
     """URL-level de-duplication cache.
 
@@ -42,6 +86,13 @@ class SeenCache:
         self.ttl = ttl_seconds
         # Use TTLCache instead of unbounded set - max 10k entries, TTL matches Redis
         self._mem: TTLCache = TTLCache(maxsize=10000, ttl=ttl_seconds)
+        # Generational pair: rotating on the TTL interval forgets a digest
+        # after one to two TTLs, so an expired URL reaches Redis again and
+        # re-ingests. Rotation also bounds saturation, since a Bloom filter
+        # cannot drop individual bits.
+        self._bloom = _BloomFilter()
+        self._bloom_prev = _BloomFilter()
+        self._bloom_rotated = time.monotonic()
         self._redis = None
         if aioredis is not None:
             try:
@@ -49,41 +100,86 @@ class SeenCache:
             except Exception:
                 self._redis = None
 
+    def _rotate_bloom(self) -> None:
+        now = time.monotonic()
+        if now - self._bloom_rotated >= self.ttl:
+            self._bloom_prev = self._bloom
+            self._bloom = _BloomFilter()
+            self._bloom_rotated = now
+
     async def mark_if_new(self, url: str) -> bool:
-        key = f"phishradar:seen:url:{_sha1(url)}"
+        return (await self.mark_if_new_many([url]))[0]
+
+    async def mark_if_new_many(self, urls: list[str]) -> list[bool]:
+        """Mark many URLs at once; one pipelined round-trip instead of N.
+
+        The per-process Bloom filter answers repeats locally; only digests it
+        has not seen go to Redis (which stays the cross-process authority).
+        """
+        self._rotate_bloom()
+        digests = [_url_digest(u) for u in urls]
+        out: list[bool] = []
+        to_check: list[int] = []
+        for i, d in enumerate(digests):
+            if d in self._bloom or d in self._bloom_prev:
+                out.append(False)  # seen by this process (modulo bloom fp)
+            else:
+                self._bloom.add(d)
+                out.append(True)  # provisional; flipped below if Redis disagrees
+                to_check.append(i)
+        if to_check:
+            keys = [f"phishradar:seen:url:{digests[i]}" for i in to_check]
+            flags = await self._mark_keys(keys)
+            for idx, flag in zip(to_check, flags):
+                out[idx] = flag
+        return out
+
+    async def _mark_keys(self, keys: list[str]) -> list[bool]:
         if self._redis is not None:
             try:
-                added = await self._redis.set(key, "1", nx=True, ex=self.ttl)  # type: ignore[attr-defined]
-                return bool(added)
+                pipe = self._redis.pipeline(transaction=False)  # type: ignore[attr-defined]
+                for key in keys:
+                    pipe.set(key, "1", nx=True, ex=self.ttl)
+                results = await pipe.execute()
+                return [bool(r) for r in results]
             except Exception:
                 pass
         # Fallback to bounded TTL cache
-        if key in self._mem:
-            return False
-        self._mem[key] = 1  # Value doesn't matter, just presence
-        return True
+        out: list[bool] = []
+        for key in keys:
+            if key in self._mem:
+                out.append(False)
+            else:
+                self._mem[key] = 1  # Value doesn't matter, just presence
+                out.append(True)
+        return out
 
 
 class FeedPoller:
     def __init__(self) -> None:
         self._task: asyncio.Task | None = None
         self._stop = asyncio.Event()
-        self._queue = IngestQueue()
+        self._queue = make_queue()
         self._seen = SeenCache(ttl_seconds=settings.feed_seen_ttl_seconds)
         self._logger = logging.getLogger(__name__)
+        # Long-lived client: keepalive across poll cycles skips the per-poll
+        # TCP+TLS handshake to both feed hosts.
+        limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        try:
+            self._client = httpx.AsyncClient(timeout=30.0, limits=limits, http2=True)
+        except ImportError:  # h2 extra not installed
+            self._client = httpx.AsyncClient(timeout=30.0, limits=limits)
 
     async def _fetch_openphish(self, client: httpx.AsyncClient) -> list[FeedItem]:
         url = settings.openphish_feed_url
         try:
             r = await client.get(url, headers={"User-Agent": "phishradar/1 feed"})
             r.raise_for_status()
-            out: list[FeedItem] = []
-            for line in r.text.splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                out.append(FeedItem(url=line, source="openphish"))
-            return out
+            return [
+                FeedItem(url=ln, source="openphish")
+                for ln in (line.strip() for line in r.text.splitlines())
+                if ln
+            ]
         except Exception as e:
             self._logger.warning(f"OpenPhish fetch failed: {e}")
             return []
@@ -95,60 +191,62 @@ class FeedPoller:
                 base, params={"per_page": min(settings.feed_batch_limit, 500)}, headers={"User-Agent": "phishradar/1 feed"}
             )
             r.raise_for_status()
-            data: list[dict[str, Any]] = r.json()  # type: ignore[assignment]
-            out: list[FeedItem] = []
-            for it in data:
-                u = it.get("url")
-                if not u:
-                    continue
-                out.append(FeedItem(url=str(u), source="sinkingyachts"))
-            return out
+            # orjson on the raw bytes skips the text decode r.json() would do
+            data: list[dict[str, Any]] = orjson.loads(r.content)
+            return [
+                FeedItem(url=str(u), source="sinkingyachts")
+                for it in data
+                if (u := it.get("url"))
+            ]
         except Exception as e:
             self._logger.warning(f"SinkingYachts fetch failed: {e}")
             return []
 
     async def _poll_once(self, *, force: bool = False, limit: int | None = None, src: str | None = None) -> int:
         new_count = 0
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            items: list[FeedItem] = []
-            take_open = src in (None, "openphish", "both")
-            take_sy = src in (None, "sinkingyachts", "both")
-            cnt_open = cnt_sy = 0
-            if take_open:
-                open_items = await self._fetch_openphish(client)
-                cnt_open = len(open_items)
-                items.extend(open_items)
-            if take_sy:
-                sy_items = await self._fetch_sinkingyachts(client)
-                cnt_sy = len(sy_items)
-                items.extend(sy_items)
+        take_open = src in (None, "openphish", "both")
+        take_sy = src in (None, "sinkingyachts", "both")
+        # The feeds are independent I/O: fetch both at once so poll wall time
+        # is max(t_open, t_sy), not the sum. Each helper catches its own
+        # errors, so gather never cancels the other fetch.
+        open_items, sy_items = await asyncio.gather(
+            self._fetch_openphish(self._client) if take_open else _empty(),
+            self._fetch_sinkingyachts(self._client) if take_sy else _empty(),
+        )
+        cnt_open, cnt_sy = len(open_items), len(sy_items)
+        items: list[FeedItem] = [*open_items, *sy_items]
         self._logger.info(f"poll_once: take_open={take_open} take_sy={take_sy} count_open={cnt_open} count_sy={cnt_sy}")
         merged = items
         # Basic URL-level dedup within this batch
         seen_local: set[str] = set()
-        now_ts = int(time.time())
+        batch: list[FeedItem] = []
         for it in merged:
-            u = it.url
-            if not u or u in seen_local:
+            if not it.url or it.url in seen_local:
                 continue
-            seen_local.add(u)
-            # Skip if seen recently via Redis unless forced
-            if not force:
-                try:
-                    is_new = await self._seen.mark_if_new(u)
-                except Exception:
-                    is_new = True
-                if not is_new:
-                    continue
-            dom = str(canonical_domain(u))
-            row = {"url": u, "domain": dom, "title": dom, "ts": now_ts, "src": it.source}
+            seen_local.add(it.url)
+            batch.append(it)
+        # Skip recently-seen URLs via Redis unless forced; one pipelined call
+        # for the whole batch instead of a round-trip per URL.
+        if force:
+            fresh = batch
+        else:
             try:
-                await self._queue.push(row)
-                new_count += 1
-            except Exception as e:
-                self._logger.warning(f"Failed to enqueue {u}: {e}")
-            if limit is not None and new_count >= max(0, int(limit)):
-                break
+                flags = await self._seen.mark_if_new_many([it.url for it in batch])
+            except Exception:
+                flags = [True] * len(batch)
+            fresh = [it for it, is_new in zip(batch, flags) if is_new]
+        if limit is not None:
+            fresh = fresh[: max(0, int(limit))]
+        now_ts = int(time.time())
+        rows = []
+        for it in fresh:
+            dom = str(canonical_domain(it.url))
+            rows.append({"url": it.url, "domain": dom, "title": dom, "ts": now_ts, "src": it.source})
+        try:
+            await self._queue.push_many(rows)
+            new_count = len(rows)
+        except Exception as e:
+            self._logger.warning(f"Failed to enqueue batch of {len(rows)}: {e}")
         if new_count:
             self._logger.info(f"Feed poller enqueued {new_count} URLs")
         return new_count
@@ -179,3 +277,4 @@ class FeedPoller:
                 await asyncio.wait_for(self._task, timeout=5)
             except Exception:
                 pass
+        await self._client.aclose()
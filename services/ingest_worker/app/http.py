@@ -3,8 +3,51 @@ from __future__ import annotations
 import httpx
 
 
-def async_http_client(timeout: float = 10.0, max_connections: int = 20, max_keepalive: int = 10) -> httpx.AsyncClient:
-    """Create an httpx.AsyncClient with sane limits for our workloads."""
-    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive)
-    return httpx.AsyncClient(timeout=timeout, limits=limits)
+class _LeasedClient:
+    """Async context manager handing out a pooled client without closing it.
 
+    Call sites keep the ``async with async_http_client(...) as client:`` shape;
+    leaving the block returns the client to the pool with its keepalive
+    connections intact instead of tearing down TCP/TLS per call.
+    """
+
+    __slots__ = ("_client",)
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
+    async def __aenter__(self) -> httpx.AsyncClient:
+        return self._client
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_clients: dict[tuple[float, int, int], httpx.AsyncClient] = {}
+
+
+def async_http_client(timeout: float = 10.0, max_connections: int = 20, max_keepalive: int = 10) -> _LeasedClient:
+    """Lease a shared httpx.AsyncClient with sane limits for our workloads.
+
+    One HTTP/2 client is kept per (timeout, limits) signature so repeat calls
+    reuse warm connections; the TLS handshake is paid once per origin, not per
+    request. Close the pool via aclose_http_clients() on shutdown.
+    """
+    key = (timeout, max_connections, max_keepalive)
+    client = _clients.get(key)
+    if client is None or client.is_closed:
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive)
+        client = httpx.AsyncClient(timeout=timeout, limits=limits, http2=True)
+        _clients[key] = client
+    return _LeasedClient(client)
+
+
+async def aclose_http_clients() -> None:
+    """Close all pooled clients (app shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception:
+            pass
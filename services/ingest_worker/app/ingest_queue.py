@@ -1,88 +1,257 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import fcntl
 import os
-from typing import Any
+import uuid
+from functools import lru_cache
+from typing import Any, Protocol
 
 import aiofiles
 import aiofiles.os
+import orjson
 from anyio import to_thread
 
+try:
+    # Prefer redis-py asyncio client if available
+    from redis import asyncio as aioredis  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    aioredis = None  # type: ignore
+
+from .config import settings
 from .paths import BUFFER_DIR  # shared buffer dir path
 
 
-QUEUE_FILE = os.path.join(BUFFER_DIR, "incoming.jsonl")
-LOCK_FILE = os.path.join(BUFFER_DIR, ".incoming.lock")
+# Compact the consumed prefix away once it exceeds this many bytes
+_COMPACT_AFTER = 1 << 20
 
+STREAM_KEY = "phishradar:ingest"
+STREAM_GROUP = "ingest"
+STREAM_MAXLEN = 100_000
 
-class IngestQueue:
-    def __init__(self) -> None:
-        os.makedirs(BUFFER_DIR, exist_ok=True)
 
-    async def _lock(self, retries: int = 50, delay: float = 0.02) -> None:
-        """Acquire file lock using async operations."""
-        for _ in range(retries):
-            try:
-                # Use thread pool for blocking os.open call
-                await to_thread.run_sync(
-                    lambda: os.close(os.open(LOCK_FILE, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
-                )
-                return
-            except FileExistsError:
-                await asyncio.sleep(delay)
-        # Best-effort: if lock persists, proceed to avoid deadlock in dev
+class Queue(Protocol):
+    async def push(self, row: dict[str, Any]) -> None: ...
+
+    async def push_many(self, rows: list[dict[str, Any]]) -> None: ...
+
+    async def fetch(self, limit: int = 10) -> list[dict[str, Any]]: ...
+
+
+class FileIngestQueue:
+    """JSONL-on-disk queue: flock for exclusion, offset cursor for drains."""
+
+    def __init__(self, buffer_dir: str | os.PathLike[str] | None = None) -> None:
+        # Injectable buffer dir so tests point at tmp_path instead of
+        # reloading modules to re-derive the env-based default
+        self.buffer_dir = str(buffer_dir or BUFFER_DIR)
+        os.makedirs(self.buffer_dir, exist_ok=True)
+        self._queue_file = os.path.join(self.buffer_dir, "incoming.jsonl")
+        self._offset_file = self._queue_file + ".off"
+        # Persistent fd for flock-based locking; never unlinked
+        self._lock_fd = os.open(os.path.join(self.buffer_dir, ".incoming.lock"), os.O_RDWR | os.O_CREAT)
+        # flock is per open file description, so tasks sharing this fd would not
+        # exclude each other; the asyncio lock covers the in-process side.
+        self._local_lock = asyncio.Lock()
+
+    async def _lock(self) -> None:
+        """Acquire the queue lock: asyncio lock in-process, flock across processes."""
+        await self._local_lock.acquire()
+        # Blocking acquire in a thread: no polling, OS queues waiters fairly
+        await to_thread.run_sync(lambda: fcntl.flock(self._lock_fd, fcntl.LOCK_EX))
 
     async def _unlock(self) -> None:
-        """Release file lock using async operations."""
-        try:
-            await aiofiles.os.remove(LOCK_FILE)
-        except FileNotFoundError:
-            pass
+        """Release the queue lock."""
+        fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        self._local_lock.release()
 
     async def push(self, row: dict[str, Any]) -> None:
-        """Push item to queue using async file I/O."""
+        await self.push_many([row])
+
+    async def push_many(self, rows: list[dict[str, Any]]) -> None:
+        """Append rows in one lock/write; serialization happens outside the lock."""
+        if not rows:
+            return
+        blob = b"".join(orjson.dumps(row) + b"\n" for row in rows)
         await self._lock()
         try:
-            async with aiofiles.open(QUEUE_FILE, "a", encoding="utf-8") as f:
-                await f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            async with aiofiles.open(self._queue_file, "ab") as f:
+                await f.write(blob)
         finally:
             await self._unlock()
 
+    async def _read_offset(self) -> int:
+        try:
+            async with aiofiles.open(self._offset_file, "r", encoding="ascii") as f:
+                return int((await f.read()).strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    async def _write_offset(self, offset: int) -> None:
+        tmp = self._offset_file + ".tmp"
+        async with aiofiles.open(tmp, "w", encoding="ascii") as f:
+            await f.write(str(offset))
+        await aiofiles.os.replace(tmp, self._offset_file)
+
     async def fetch(self, limit: int = 10) -> list[dict[str, Any]]:
-        """Fetch items from queue using async file I/O."""
+        # Consume via a sidecar byte-offset cursor instead of rewriting the whole
+        # file on each fetch; cost is O(limit), not O(file size).
         await self._lock()
         try:
-            lines: list[str] = []
+            offset = await self._read_offset()
+            take_lines: list[str] = []
             try:
-                async with aiofiles.open(QUEUE_FILE, "r", encoding="utf-8") as f:
-                    lines = await f.readlines()
+                async with aiofiles.open(self._queue_file, "r", encoding="utf-8") as f:
+                    await f.seek(offset)
+                    for _ in range(max(0, int(limit))):
+                        ln = await f.readline()
+                        if not ln:
+                            break
+                        take_lines.append(ln)
+                    offset = await f.tell()
+                    drained = not await f.readline()
             except FileNotFoundError:
-                lines = []
-
-            if not lines:
                 return []
-            # Pop first N
-            to_take = max(0, min(limit, len(lines)))
-            take_lines = lines[:to_take]
-            rest_lines = lines[to_take:]
-            # Rewrite rest
-            if rest_lines:
-                async with aiofiles.open(QUEUE_FILE + ".tmp", "w", encoding="utf-8") as f:
-                    await f.writelines(rest_lines)
-                await aiofiles.os.replace(QUEUE_FILE + ".tmp", QUEUE_FILE)
+            if drained:
+                # Fully consumed: drop both files instead of keeping a dead prefix
+                for path in (self._queue_file, self._offset_file):
+                    try:
+                        await aiofiles.os.remove(path)
+                    except FileNotFoundError:
+                        pass
+            elif offset > _COMPACT_AFTER:
+                # Truncate the consumed prefix so the file cannot grow unbounded
+                async with aiofiles.open(self._queue_file, "r", encoding="utf-8") as f:
+                    await f.seek(offset)
+                    rest = await f.read()
+                async with aiofiles.open(self._queue_file + ".tmp", "w", encoding="utf-8") as f:
+                    await f.write(rest)
+                await aiofiles.os.replace(self._queue_file + ".tmp", self._queue_file)
+                await self._write_offset(0)
             else:
-                # Empty queue
-                try:
-                    await aiofiles.os.remove(QUEUE_FILE)
-                except FileNotFoundError:
-                    pass
-            out: list[dict[str, Any]] = []
-            for ln in take_lines:
+                await self._write_offset(offset)
+        finally:
+            await self._unlock()
+        # Parse outside the lock; only file I/O needs the critical section
+        out: list[dict[str, Any]] = []
+        for ln in take_lines:
+            try:
+                out.append(orjson.loads(ln))
+            except Exception:
+                continue
+        return out
+
+
+class RedisStreamIngestQueue:
+    """Redis Stream queue: O(1) push/pop, consumer groups for scale-out."""
+
+    def __init__(self) -> None:
+        if aioredis is None:
+            raise RuntimeError("redis backend requested but redis package is unavailable")
+        self._redis = aioredis.from_url(settings.redis_url, decode_responses=True)
+        self._consumer = uuid.uuid4().hex
+        self._group_ready = False
+
+    async def _ensure_group(self) -> None:
+        if self._group_ready:
+            return
+        try:
+            await self._redis.xgroup_create(STREAM_KEY, STREAM_GROUP, id="0", mkstream=True)
+        except Exception as e:
+            # BUSYGROUP means the group already exists; anything else propagates
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    async def push(self, row: dict[str, Any]) -> None:
+        await self._redis.xadd(
+            STREAM_KEY, {"row": orjson.dumps(row).decode()}, maxlen=STREAM_MAXLEN, approximate=True
+        )
+
+    async def push_many(self, rows: list[dict[str, Any]]) -> None:
+        """Pipeline all XADDs into one round-trip."""
+        if not rows:
+            return
+        pipe = self._redis.pipeline(transaction=False)
+        for row in rows:
+            pipe.xadd(
+                STREAM_KEY,
+                {"row": orjson.dumps(row).decode()},
+                maxlen=STREAM_MAXLEN,
+                approximate=True,
+            )
+        await pipe.execute()
+
+    async def fetch(self, limit: int = 10) -> list[dict[str, Any]]:
+        await self._ensure_group()
+        resp = await self._redis.xreadgroup(
+            groupname=STREAM_GROUP,
+            consumername=self._consumer,
+            streams={STREAM_KEY: ">"},
+            count=max(0, int(limit)),
+            block=1000,
+        )
+        out: list[dict[str, Any]] = []
+        ids: list[str] = []
+        for _stream, entries in resp or []:
+            for mid, fields in entries:
+                ids.append(mid)
                 try:
-                    out.append(json.loads(ln))
+                    out.append(orjson.loads(fields.get("row", "")))
                 except Exception:
                     continue
-            return out
-        finally:
-            await self._unlock()
+        if ids:
+            await self._redis.xack(STREAM_KEY, STREAM_GROUP, *ids)
+        return out
+
+
+class IngestQueue:
+    """Default backend: Redis Stream when reachable, JSONL file otherwise.
+
+    The first failed stream call flips the instance to the file path for its
+    lifetime, so dev and degraded environments keep working without Redis.
+    """
+
+    def __init__(self, buffer_dir: str | os.PathLike[str] | None = None) -> None:
+        self._file = FileIngestQueue(buffer_dir)
+        self._stream: RedisStreamIngestQueue | None = None
+        if aioredis is not None:
+            try:
+                self._stream = RedisStreamIngestQueue()
+            except Exception:
+                self._stream = None
+
+    async def push(self, row: dict[str, Any]) -> None:
+        await self.push_many([row])
+
+    async def push_many(self, rows: list[dict[str, Any]]) -> None:
+        if self._stream is not None:
+            try:
+                await self._stream.push_many(rows)
+                return
+            except Exception:
+                self._stream = None
+        await self._file.push_many(rows)
+
+    async def fetch(self, limit: int = 10) -> list[dict[str, Any]]:
+        if self._stream is not None:
+            try:
+                return await self._stream.fetch(limit)
+            except Exception:
+                self._stream = None
+        return await self._file.fetch(limit)
+
+
+@lru_cache(maxsize=1)
+def make_queue() -> Queue:
+    """Return the shared ingest queue configured by settings.ingest_backend.
+
+    Cached: FileIngestQueue holds an open lock fd and the stream client keeps
+    a connection, so constructing one per request would leak both.
+    """
+    backend = settings.ingest_backend
+    if backend == "file":
+        return FileIngestQueue()
+    if backend == "redis":
+        return RedisStreamIngestQueue()
+    return IngestQueue()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import IO
+
+import orjson
+from anyio import to_thread
+
+from .paths import BUFFER_DIR
+
+
+class JsonlWriter:
+    """Buffered appender for the local events/receipts JSONL files.
+
+    Per-call open+write+close cost one syscall round per receipt; here lines
+    are queued and a background task drains them into long-lived buffered
+    handles, flushing about once a second. The queue is bounded so a stuck
+    disk surfaces as backpressure instead of unbounded memory. With the task
+    not running (tests, scripts), append() degrades to a direct write.
+
+    An io_uring submission path was considered for the flush and rejected:
+    the liburing binding would be our only compiled platform-specific
+    dependency, and with appends already batched into ~one buffered write
+    per wake the syscall count no longer limits this path.
+    """
+
+    def __init__(
+        self, maxsize: int = 10_000, drain_max: int = 1000, flush_interval: float = 1.0
+    ) -> None:
+        self._queue: asyncio.Queue[tuple[str, bytes]] = asyncio.Queue(maxsize=maxsize)
+        self._files: dict[str, IO[bytes]] = {}
+        self._task: asyncio.Task | None = None
+        self._drain_max = drain_max
+        self._flush_interval = flush_interval
+
+    def _file(self, name: str) -> IO[bytes]:
+        f = self._files.get(name)
+        if f is None:
+            os.makedirs(BUFFER_DIR, exist_ok=True)
+            f = open(os.path.join(BUFFER_DIR, name), "ab", buffering=1 << 16)
+            self._files[name] = f
+        return f
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="jsonl-writer")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        # Drain anything still queued, then durably flush and close
+        while not self._queue.empty():
+            name, line = self._queue.get_nowait()
+            self._file(name).write(line)
+        for f in self._files.values():
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+        self._files.clear()
+
+    async def append(self, name: str, obj: dict) -> None:  # type: ignore[type-arg]
+        line = orjson.dumps(obj) + b"\n"
+        if self._task is None or self._task.done():
+            f = self._file(name)
+            f.write(line)
+            f.flush()
+            return
+        await self._queue.put((name, line))
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        last_flush = loop.time()
+        while True:
+            name, line = await self._queue.get()
+            batch: dict[str, list[bytes]] = {name: [line]}
+            # Gather whatever else arrives within 10 ms, up to drain_max lines
+            taken = 1
+            deadline = loop.time() + 0.01
+            while taken < self._drain_max:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    name, line = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.setdefault(name, []).append(line)
+                taken += 1
+            # Write in a thread: a disk stall must not hold up the event loop.
+            # This is the only writer coroutine, so ordering is preserved.
+            for fname, lines in batch.items():
+                f = self._file(fname)
+                buf = b"".join(lines)
+                await to_thread.run_sync(lambda: f.write(buf))  # noqa: B023
+            now = loop.time()
+            if now - last_flush >= self._flush_interval:
+                for f in self._files.values():
+                    await to_thread.run_sync(f.flush)
+                last_flush = now
+
+
+# Shared instance; started/stopped from the app lifespan
+jsonl_writer = JsonlWriter()
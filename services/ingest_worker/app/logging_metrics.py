@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import contextvars
-import json
 import logging
 import time
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Response
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
@@ -63,6 +63,12 @@ qdrant_latency_seconds = Histogram(
     "phishradar_qdrant_latency_seconds", "Qdrant op latency", ["op"], registry=registry,
     buckets=(0.02, 0.05, 0.1, 0.25, 0.5, 1, 2)
 )
+# Backoff sleep per retry: the tail of this histogram shows whether
+# RETRY_MAX_DELAY is sized right without redeploying to find out
+qdrant_retry_wait_seconds = Histogram(
+    "phishradar_qdrant_retry_wait_seconds", "Qdrant retry backoff sleep", ["op"], registry=registry,
+    buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10)
+)
 
 # BigQuery metrics
 bq_writes_total = Counter(
@@ -109,7 +115,7 @@ class JsonFormatter(logging.Formatter):
         }
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=False)
+        return orjson.dumps(payload).decode()
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import base64
 import hashlib
-import json
+import itertools
 import logging
 import os
 import time
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import AsyncIterator, Any
+from urllib.parse import parse_qsl, unquote_to_bytes, urlparse
 
+import numpy as np
+import orjson
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
 
@@ -29,9 +35,40 @@ from .logging_metrics import (
 )
 
 
+async def _ollama_keepalive(emb: Any, interval: float = 240.0) -> None:
+    """Re-ping Ollama periodically so the model stays resident across idle."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await emb.warmup()
+        except Exception:
+            pass
+
+
+def _check_sha_acceleration() -> None:
+    """Warn if STRICT_CID sha256 hashing lacks hardware acceleration.
+
+    With strict correlation ids every request pays a sha256; OpenSSL uses the
+    x86 SHA extensions (sha_ni) when present, otherwise the scalar fallback is
+    several times slower. Best-effort: /proc/cpuinfo is Linux-only.
+    """
+    import ssl
+
+    log = logging.getLogger(__name__)
+    log.info(f"cid_hash=sha256 openssl={ssl.OPENSSL_VERSION}")
+    try:
+        with open("/proc/cpuinfo") as f:
+            if "sha_ni" not in f.read():
+                log.warning("CPU lacks sha_ni; STRICT_CID sha256 runs unaccelerated")
+    except OSError:
+        pass
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     setup_logging(settings.log_level)
+    if settings.strict_cid:
+        _check_sha_acceleration()
     # OTel instrumentation (safe if exporter unset)
     try:
         FastAPIInstrumentor.instrument_app(app)  # type: ignore[name-defined]
@@ -46,6 +83,15 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         dim = await emb.dim()
         logging.getLogger(__name__).info(f"EMBED_DIM={dim} (model={emb.model})")
         app.state.embed_dim = dim  # type: ignore[attr-defined]
+        app.state.embedder = emb  # type: ignore[attr-defined]
+        # Pin the model in memory so the first request after idle stays warm
+        try:
+            await emb.warmup()
+        except Exception as we:
+            logging.getLogger(__name__).warning(f"Ollama warmup failed: {we}")
+        app.state.keepalive_task = asyncio.create_task(  # type: ignore[attr-defined]
+            _ollama_keepalive(emb), name="ollama-keepalive"
+        )
         # Ensure Qdrant collection and payload indexes
         try:
             from .qdrant_client import QdrantStore
@@ -63,6 +109,12 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         logging.getLogger(__name__).warning(f"Socket Mode start failed: {e}")
     # Feed poller is not auto-started; triggered on demand via /sources/sync
+    # Coalesce concurrent /embed requests into shared Ollama batches
+    embed_batcher.start()
+    # Coalesce concurrent /dedup requests into shared Qdrant round-trips
+    dedup_batcher.start()
+    # Buffered writer for the local events/receipts JSONL files
+    jsonl_writer.start()
     # Mark ready after startup tasks
     set_ready()
     yield
@@ -72,9 +124,39 @@ async def lifespan(_: FastAPI) -> AsyncIterator[None]:
         await stop_socket_mode()
     except Exception:
         pass
+    try:
+        await embed_batcher.stop()
+    except Exception:
+        pass
+    try:
+        await dedup_batcher.stop()
+    except Exception:
+        pass
+    try:
+        await jsonl_writer.stop()
+    except Exception:
+        pass
+    task = getattr(app.state, "keepalive_task", None)  # type: ignore[attr-defined]
+    if task is not None:
+        task.cancel()
+    try:
+        from .embeddings import aclose_client
+
+        await aclose_client()
+    except Exception:
+        pass
+    try:
+        from .http import aclose_http_clients
+
+        await aclose_http_clients()
+    except Exception:
+        pass
     # No background feed poller to stop (manual trigger only)
 
 
+# Responses stay on FastAPI's default path: with response_model set, pydantic
+# core already serializes straight to JSON bytes (ORJSONResponse is deprecated
+# and slower for model-returning routes). orjson is used for request parsing.
 app = FastAPI(title="PhishRadar Ingest Worker", version="0.1.0", lifespan=lifespan)
 app.include_router(metrics_router)
 
@@ -87,10 +169,27 @@ app.add_middleware(
 )
 
 
+# Probe/scrape endpoints skip the correlation and metrics work entirely:
+# liveness checks and Prometheus scrapes should not pay per-request overhead
+# (or pollute the request metrics they feed).
+_UNTRACKED_PATHS = ("/healthz", "/metrics")
+
+# Correlation ids are opaque trace handles; worker id + monotonic counter is
+# O(1), hash-free, and keeps the (potentially sensitive) URL out of the id.
+# next() on itertools.count is atomic under the GIL. STRICT_CID keeps the old
+# URL-derived sha256 for deployments that correlate ids across replays.
+_CID_COUNTER = itertools.count()
+_CID_PID = os.getpid() & 0xFFFF
+
+
 @app.middleware("http")
 async def correlation_mw(request: Request, call_next):  # type: ignore[no-untyped-def]
-    url = str(request.url)
-    cid = hashlib.sha256(url.encode()).hexdigest()[:16]
+    if request.url.path in _UNTRACKED_PATHS:
+        return await call_next(request)
+    if settings.strict_cid:
+        cid = hashlib.sha256(str(request.url).encode()).hexdigest()[:16]
+    else:
+        cid = f"{_CID_PID:04x}{next(_CID_COUNTER):012x}"
     token = correlation_id.set(cid)
     try:
         response = await call_next(request)
@@ -100,8 +199,20 @@ async def correlation_mw(request: Request, call_next):  # type: ignore[no-untype
         correlation_id.reset(token)
 
 
+@lru_cache(maxsize=1024)
+def _lat(path: str):  # type: ignore[no-untyped-def]
+    return latency_hist.labels(path=path)
+
+
+@lru_cache(maxsize=1024)
+def _cnt(path: str, method: str, status: str):  # type: ignore[no-untyped-def]
+    return req_counter.labels(path=path, method=method, status=status)
+
+
 @app.middleware("http")
 async def metrics_middleware(request: Request, call_next):  # type: ignore[no-untyped-def]
+    if request.url.path in _UNTRACKED_PATHS:
+        return await call_next(request)
     start = time.perf_counter()
     status = "500"
     try:
@@ -110,10 +221,13 @@ async def metrics_middleware(request: Request, call_next):  # type: ignore[no-un
         return response
     finally:
         elapsed = time.perf_counter() - start
-        path = request.url.path
+        # Route template, not the raw URL: bounds label cardinality against
+        # attacker-controlled paths and lets the child-metric cache stay small
+        route = request.scope.get("route")
+        path = getattr(route, "path", None) or request.url.path
         try:
-            latency_hist.labels(path=path).observe(elapsed)
-            req_counter.labels(path=path, method=request.method, status=status).inc()
+            _lat(path).observe(elapsed)
+            _cnt(path, request.method, status).inc()
         except Exception:
             pass
 
@@ -133,7 +247,11 @@ from fastapi import Body, HTTPException, Header, Form  # noqa: E402
 from .models import (
     EmbedIn,
     EmbedOut,
+    EmbedBatchIn,
+    EmbedBatchOut,
+    EmbedDedupOut,
     DedupIn,
+    DedupBatchIn,
     DedupOut,
     SlackNotifyIn,
     UrlItem,
@@ -141,7 +259,12 @@ from .models import (
     EnrichOut,
 )  # noqa: E402
 from .embeddings import OllamaEmbeddings  # noqa: E402
-from .dedup import upsert_and_check  # noqa: E402
+from .embed_batcher import embed_batcher  # noqa: E402
+from .dedup_batcher import dedup_batcher  # noqa: E402
+from .jsonl_writer import jsonl_writer  # noqa: E402
+from .sem_cache import sem_cache  # noqa: E402
+from .qdrant_client import id_key  # noqa: E402
+from .dedup import upsert_and_check_many  # noqa: E402
 from .slack import (
     send_message,
     verify_signature,
@@ -155,12 +278,64 @@ from .domain import canonical_domain  # noqa: E402
 from .bq import write_receipts, write_events  # noqa: E402
 from .dlq import write_dlq  # noqa: E402
 from .paths import BUFFER_DIR  # noqa: E402
-from .ingest_queue import IngestQueue  # noqa: E402
+from .ingest_queue import make_queue  # noqa: E402
 from .feed_poller import FeedPoller  # noqa: E402
 
 
+def _wants_form(request: Request) -> bool:
+    # Only pay Starlette's form re-read/parse for actual form submissions
+    ctype = request.headers.get("content-type", "")
+    return "application/x-www-form-urlencoded" in ctype or "multipart/form-data" in ctype
+
+
+def _quantize_int8(vec: np.ndarray) -> tuple[str, float]:
+    """Quantize a float vector to base64 int8 plus a scale (~10x smaller wire)."""
+    scale = float(np.abs(vec).max()) / 127.0 or 1.0
+    q = np.round(vec / scale).astype(np.int8)
+    return base64.b64encode(q.tobytes()).decode(), scale
+
+
+def _dequantize_int8(b64: str, scale: float) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(b64), dtype=np.int8).astype(np.float32) * scale
+
+
+# The loop keeps only weak refs to tasks; a fire-and-forget task with no
+# other reference can be garbage-collected mid-flight. Park background
+# tasks here until they finish.
+_bg_tasks: set[asyncio.Task] = set()
+
+
+def _spawn_bg(coro) -> None:
+    """Run a never-raises coroutine in the background, holding a strong ref."""
+    task = asyncio.create_task(coro)
+    _bg_tasks.add(task)
+    task.add_done_callback(_bg_tasks.discard)
+
+
+async def _record_receipt(receipt: dict[str, Any]) -> None:
+    """Write an embed receipt locally and to BigQuery; never raises."""
+    try:
+        await jsonl_writer.append("receipts.jsonl", receipt)
+    except Exception:
+        pass
+    try:
+        await write_receipts([receipt])
+    except Exception:
+        # bq module writes DLQ on failure
+        pass
+
+
+async def _upsert_dedup_point(url: str, vec: np.ndarray, payload: dict[str, Any]) -> None:
+    """Persist a point whose dedup verdict came from the semantic cache; never raises."""
+    try:
+        await dedup_batcher.submit(url, vec, payload)
+    except Exception:
+        # batcher path writes DLQ on upsert failure
+        pass
+
+
 @app.post("/embed", response_model=EmbedOut)
-async def embed(request: Request) -> EmbedOut:
+async def embed(request: Request) -> Response:
     """Return embedding for the given URL/title/domain.
 
     Primary contract: JSON body matching EmbedIn. For resilience with tools like n8n
@@ -180,13 +355,14 @@ async def embed(request: Request) -> EmbedOut:
         domain_val = data.get("domain") or None
     else:
         # Try form or query
-        try:
-            form = await request.form()
-            url_val = url_val or form.get("url")
-            title_val = title_val or form.get("title")
-            domain_val = domain_val or form.get("domain")
-        except Exception:
-            pass
+        if _wants_form(request):
+            try:
+                form = await request.form()
+                url_val = url_val or form.get("url")
+                title_val = title_val or form.get("title")
+                domain_val = domain_val or form.get("domain")
+            except Exception:
+                pass
         if not url_val:
             url_val = request.query_params.get("url")
         if not title_val:
@@ -199,122 +375,246 @@ async def embed(request: Request) -> EmbedOut:
             # fallback title = domain
             title_val = canonical_domain(str(url_val))
     dom = canonical_domain(str(url_val))
-    emb = OllamaEmbeddings()
-    vector, ms, model = await emb.embed_async_single(f"{url_val} | {title_val} | {dom}")
+    vector, ms, model = await embed_batcher.submit(f"{url_val} | {title_val} | {dom}")
+    # Receipts are bookkeeping, not part of the response: record them in the
+    # background so their I/O never sits on the embed critical path.
+    _spawn_bg(_record_receipt({"model": model, "tokens": 0, "ms": ms, "cost": 0.0}))
+    # Serialize the vector with orjson directly: round-tripping a 1024-float
+    # list through EmbedOut validation + model serialization dominates the
+    # handler's CPU time (response_model stays on the route for the schema).
+    out: dict[str, Any] = {
+        "model": model,
+        "ms": ms,
+        "url": str(url_val),
+        "title": str(title_val or dom),
+        "domain": dom,
+    }
+    want_int8 = request.query_params.get("int8") in ("1", "true") or bool(
+        isinstance(data, dict) and data.get("int8")
+    )
+    if want_int8:
+        # Opt-in quantized transport: ~10x smaller than the float JSON list
+        out["vector_int8"], out["scale"] = _quantize_int8(np.asarray(vector, dtype=np.float32))
+    else:
+        out["vector"] = vector
+    body_bytes = orjson.dumps(out, option=orjson.OPT_SERIALIZE_NUMPY)
+    return Response(content=body_bytes, media_type="application/json")
+
+
+MAX_EMBED_BATCH = 64
+
+
+@app.post("/embed_batch", response_model=EmbedBatchOut)
+async def embed_batch(body: EmbedBatchIn) -> Response:
+    """Embed a batch of items in one request, amortizing HTTP/JSON overhead."""
+    if not body.items:
+        raise HTTPException(status_code=422, detail="items required")
+    if len(body.items) > MAX_EMBED_BATCH:
+        raise HTTPException(status_code=422, detail=f"max {MAX_EMBED_BATCH} items per batch")
+    emb = getattr(app.state, "embedder", None) or OllamaEmbeddings()  # type: ignore[attr-defined]
+    t0 = time.perf_counter()
+    results = await emb.embed_async_many(
+        [f"{it.url} | {it.title} | {canonical_domain(str(it.url))}" for it in body.items]
+    )
+    ms = int((time.perf_counter() - t0) * 1000)
+    model = results[0][2]
     try:
-        _append_jsonl("receipts.jsonl", {"model": model, "tokens": 0, "ms": ms, "cost": 0.0})
+        await jsonl_writer.append("receipts.jsonl", {"model": model, "tokens": 0, "ms": ms, "cost": 0.0})
     except Exception:
         pass
     try:
-        await write_receipts([
-            {"model": model, "tokens": 0, "ms": ms, "cost": 0.0}
-        ])
+        await write_receipts([{"model": model, "tokens": 0, "ms": ms, "cost": 0.0}])
+    except Exception:
+        pass
+    # Same orjson bypass as /embed: the vectors are float32 ndarrays and
+    # OPT_SERIALIZE_NUMPY streams them without a tolist() blow-up.
+    body_bytes = orjson.dumps(
+        {"vectors": [vec for vec, _, _ in results], "model": model, "ms": ms},
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    )
+    return Response(content=body_bytes, media_type="application/json")
+
+
+@app.post("/dedup_batch", response_model=list[DedupOut])
+async def dedup_batch(body: DedupBatchIn) -> list[DedupOut]:
+    """Dedup a batch of already-embedded items in one request."""
+    if not body.items:
+        raise HTTPException(status_code=422, detail="items required")
+    embed_dim = getattr(app.state, "embed_dim", None)  # type: ignore[attr-defined]
+    dedup_requests_total.inc(len(body.items))
+    vecs: list[np.ndarray] = []
+    for it in body.items:
+        if it.vector is not None:
+            vecs.append(it.vector)
+        elif it.vector_b64 is not None:
+            try:
+                vecs.append(np.frombuffer(base64.b64decode(it.vector_b64), dtype=np.float32))
+            except (ValueError, TypeError):
+                raise HTTPException(status_code=400, detail="empty or invalid vector")
+        elif it.vector_int8 is not None and it.scale is not None:
+            try:
+                vecs.append(_dequantize_int8(it.vector_int8, it.scale))
+            except (ValueError, TypeError):
+                raise HTTPException(status_code=400, detail="empty or invalid vector")
+        else:
+            raise HTTPException(status_code=400, detail="empty or invalid vector")
+    if embed_dim is not None:
+        for v in vecs:
+            if len(v) != int(embed_dim):
+                raise HTTPException(status_code=400, detail="vector dimension mismatch")
+    results = await upsert_and_check_many(
+        [(str(it.url), vec, it.payload) for it, vec in zip(body.items, vecs)]
+    )
+    dups = sum(1 for dup, _, _ in results if dup)
+    if dups:
+        dedup_duplicates_total.inc(dups)
+    return [DedupOut(is_duplicate=d, similarity=s, qdrant_id=q) for d, s, q in results]
+
+
+@app.post("/embed_and_dedup", response_model=EmbedDedupOut)
+async def embed_and_dedup(body: EmbedIn) -> EmbedDedupOut:
+    """Embed and dedup in one round-trip.
+
+    Saves a second HTTP hop plus a ~dim-sized vector serialization for callers
+    (e.g. the seeder) that do not need the vector itself.
+    """
+    dedup_requests_total.inc()
+    dom = canonical_domain(str(body.url))
+    vector, ms, model = await embed_batcher.submit(f"{body.url} | {body.title} | {dom}")
+    try:
+        await jsonl_writer.append("receipts.jsonl", {"model": model, "tokens": 0, "ms": ms, "cost": 0.0})
+    except Exception:
+        pass
+    try:
+        await write_receipts([{"model": model, "tokens": 0, "ms": ms, "cost": 0.0}])
     except Exception:
-        # bq module writes DLQ on failure
         pass
-    return EmbedOut(vector=vector, model=model, ms=ms, url=str(url_val), title=str(title_val or dom), domain=dom)
+    payload = {"domain": dom, "title": body.title, "ts": int(time.time())}
+    dup, sim, qid = await dedup_batcher.submit(str(body.url), vector, payload)
+    if dup:
+        dedup_duplicates_total.inc()
+    return EmbedDedupOut(
+        is_duplicate=dup, similarity=sim, qdrant_id=qid, vector_dim=len(vector), model=model, ms=ms
+    )
 
 
 @app.post("/dedup", response_model=DedupOut)
 async def dedup(request: Request) -> DedupOut:
     dedup_requests_total.inc()
-    # Accept JSON body (preferred) or form-encoded fields; tolerate stringified vector/payload
+    # Accept JSON body (preferred) or form-encoded fields; tolerate stringified
+    # vector/payload. The body is read and parsed exactly once: the old ladder
+    # re-read and re-parsed it up to three times on the fallback paths.
     url_val: str | None = None
     vector_val: list[float] | None = None
+    b64_val: str | None = None
+    int8_val: str | None = None
+    scale_val: float | None = None
     payload_val: dict | None = None  # type: ignore[type-arg]
 
-    # Try JSON body first
+    raw = await request.body()
     try:
-        body = await request.json()
+        data = orjson.loads(raw)
     except Exception:
-        body = None
-    if isinstance(body, dict) and body:
-        url_val = str(body.get("url") or "") or None
-        vector_val = body.get("vector")
-        payload_val = body.get("payload") if isinstance(body.get("payload"), dict) else None
-    else:
-        # Try to parse JSON or form
-        raw_handled = False
+        data = None
+    if not isinstance(data, dict) or not data:
+        # Form-encoded fallback (n8n misconfiguration); values stay strings
         try:
-            data = await request.json()
-            raw_handled = True
+            data = dict(parse_qsl(raw.decode("latin-1")))
         except Exception:
             data = None
-        if isinstance(data, dict) and data:
-            url_val = str(data.get("url") or "") or None
-            vector_val = data.get("vector")  # may be list or str
-            payload_val = data.get("payload") if isinstance(data.get("payload"), dict) else None
-            if isinstance(vector_val, str):
-                try:
-                    import json as _json
-
-                    vector_val = _json.loads(vector_val)
-                except Exception:
-                    vector_val = None
-        if url_val is None or vector_val is None:
-            # Try form fields
+    if isinstance(data, dict) and data:
+        url_val = str(data.get("url") or "") or None
+        vector_val = data.get("vector")  # may be list or stringified JSON
+        b64_val = data.get("vector_b64")
+        int8_val = data.get("vector_int8")
+        scale_val = data.get("scale")
+        if isinstance(vector_val, str):
             try:
-                form = await request.form()
-                url_val = url_val or form.get("url")
-                v = form.get("vector")
-                if v and isinstance(v, str):
-                    try:
-                        import json as _json
-
-                        vector_val = _json.loads(v)
-                    except Exception:
-                        vector_val = None
-                if payload_val is None:
-                    p = form.get("payload")
-                    if p and isinstance(p, str):
-                        try:
-                            import json as _json
-
-                            payload_val = _json.loads(p)
-                        except Exception:
-                            payload_val = None
+                vector_val = orjson.loads(vector_val)
             except Exception:
-                if not raw_handled:
-                    # Last resort: read raw and attempt JSON
-                    try:
-                        raw = await request.body()
-                        import json as _json
-
-                        d2 = _json.loads(raw.decode("utf-8"))
-                        url_val = url_val or d2.get("url")
-                        vector_val = vector_val or d2.get("vector")
-                        payload_val = payload_val or d2.get("payload")
-                    except Exception:
-                        pass
+                vector_val = None
+        payload_val = data.get("payload")
+        if isinstance(payload_val, str):
+            try:
+                payload_val = orjson.loads(payload_val)
+            except Exception:
+                payload_val = None
+        if not isinstance(payload_val, dict):
+            payload_val = None
 
     if not url_val:
         raise HTTPException(status_code=422, detail="url required")
-    if not isinstance(vector_val, list) or not vector_val:
-        raise HTTPException(status_code=400, detail="empty or invalid vector")
+    if vector_val is None and b64_val is not None:
+        # Zero-copy transport: base64 float32 bytes become one frombuffer call
+        # instead of JSON-parsing and re-boxing N floats
+        try:
+            vec = np.frombuffer(base64.b64decode(b64_val), dtype=np.float32)
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="empty or invalid vector")
+        if vec.size == 0:
+            raise HTTPException(status_code=400, detail="empty or invalid vector")
+    elif vector_val is None and int8_val is not None and scale_val is not None:
+        # Quantized transport from /embed?int8=true
+        try:
+            vec = _dequantize_int8(str(int8_val), float(scale_val))
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="empty or invalid vector")
+        if vec.size == 0:
+            raise HTTPException(status_code=400, detail="empty or invalid vector")
+    else:
+        if not isinstance(vector_val, list) or not vector_val:
+            raise HTTPException(status_code=400, detail="empty or invalid vector")
+        # One contiguous float32 buffer for the dim check, cache math, and wire
+        try:
+            vec = np.asarray(vector_val, dtype=np.float32)
+        except (TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="empty or invalid vector")
 
     # Validate dimension if known
     embed_dim = getattr(app.state, "embed_dim", None)  # type: ignore[attr-defined]
-    if embed_dim is not None and len(vector_val) != int(embed_dim):
+    if embed_dim is not None and vec.shape[0] != int(embed_dim):
         raise HTTPException(status_code=400, detail="vector dimension mismatch")
 
     payload_val = payload_val or {}
-    dup, sim, qid = await upsert_and_check(str(url_val), vector_val, payload_val)
+    # Semantic tier: a >=tau neighbor of a recent upsert is a duplicate of
+    # that point (tau sits above both dedup floors), so only the search is
+    # skipped — the point itself is still persisted off the critical path
+    cached = sem_cache.lookup(vec)
+    if cached is not None:
+        sim, qid = cached
+        dup = True
+        _spawn_bg(_upsert_dedup_point(str(url_val), vec, payload_val))
+    else:
+        dup, sim, qid = await dedup_batcher.submit(str(url_val), vec, payload_val)
+        sem_cache.add(vec, id_key(str(url_val)))
     if dup:
         dedup_duplicates_total.inc()
     return DedupOut(is_duplicate=dup, similarity=sim, qdrant_id=qid)
 
 
-@app.post("/ingest/fetch")
-async def ingest_fetch(request: Request) -> list[UrlItem]:
+@app.post("/ingest/fetch", response_model=list[UrlItem])
+async def ingest_fetch(request: Request) -> Response:
     # Pop up to `limit` items from the local file-backed queue. Returns [] if empty.
     try:
         limit_str = request.query_params.get("limit")
         limit = max(1, min(50, int(limit_str))) if limit_str else 10
     except Exception:
         limit = 10
-    q = IngestQueue()
+    q = make_queue()
     rows = await q.fetch(limit=limit)
-    return [UrlItem(url=r["url"], domain=r["domain"], ts=r["ts"]) for r in rows]
+    # Queue rows were validated on enqueue; dump them with orjson instead of
+    # round-tripping each through a UrlItem just to re-serialize it.
+    body_bytes = orjson.dumps(
+        [{"url": r["url"], "domain": r["domain"], "ts": r["ts"]} for r in rows]
+    )
+    return Response(content=body_bytes, media_type="application/json")
+
+
+# One poller across /sources/sync calls: keeps the pooled feed HTTP client
+# and the seen-URL cache (Bloom filter) alive between syncs.
+@lru_cache(maxsize=1)
+def _feed_poller() -> FeedPoller:
+    return FeedPoller()
 
 
 @app.post("/sources/sync")
@@ -336,7 +636,7 @@ async def sources_sync(request: Request) -> dict[str, int]:
     except Exception:
         force, limit, src = False, None, None
     try:
-        poller = FeedPoller()
+        poller = _feed_poller()
         logging.getLogger(__name__).info(f"sources_sync: force={force} limit={limit} src={src}")
         count = await poller._poll_once(force=force, limit=limit, src=src)
     except Exception:
@@ -359,11 +659,28 @@ async def ingest_submit(body: dict = Body(...)) -> dict[str, bool]:  # type: ign
         "title": body.get("title") or dom,
         "ts": datetime.now(timezone.utc).isoformat(),
     }
-    q = IngestQueue()
+    q = make_queue()
     await q.push(row)
     return {"ok": True}
 
 
+# The same phishing domains recur heavily across feed items; cache their parses.
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    # Slice the authority out directly - urlparse builds a full SplitResult
+    # and validates the scheme for the one field needed here. Scheme-less or
+    # odd inputs keep urlparse's exact behavior.
+    i = url.find("://")
+    if i < 0:
+        return urlparse(url).netloc or ""
+    s = url[i + 3 :]
+    for sep in ("/", "?", "#"):
+        j = s.find(sep)
+        if j >= 0:
+            s = s[:j]
+    return s
+
+
 @app.post("/enrich", response_model=EnrichOut)
 async def enrich(request: Request, body: EnrichIn | None = Body(None)) -> EnrichOut:
     """Enrich URL with minimal metadata.
@@ -371,27 +688,24 @@ async def enrich(request: Request, body: EnrichIn | None = Body(None)) -> Enrich
     Accepts JSON body {"url": ...}. If body is missing (e.g., n8n misconfigured),
     falls back to parsing form-encoded or query param `url`.
     """
-    from urllib.parse import urlparse
-
     url_val: str | None = None
     if body and getattr(body, "url", None):
         url_val = str(body.url)
     else:
         # Try form
-        try:
-            form = await request.form()
-            url_val = form.get("url") or url_val
-        except Exception:
-            pass
+        if _wants_form(request):
+            try:
+                form = await request.form()
+                url_val = form.get("url") or url_val
+            except Exception:
+                pass
         # Try query string
         if not url_val:
             url_val = request.query_params.get("url")
         if not url_val:
             raise HTTPException(status_code=422, detail="url required")
 
-    parsed = urlparse(str(url_val))
-    title = parsed.netloc or ""
-    return EnrichOut(url=str(url_val), title=title, snapshot_hash=None)
+    return EnrichOut(url=str(url_val), title=_netloc(str(url_val)), snapshot_hash=None)
 
 
 @app.post("/log")
@@ -415,14 +729,12 @@ async def log_event(request: Request, payload: Any = Body(None)) -> dict[str, bo
         except Exception:
             pass
         # Try form (payload field containing JSON)
-        if data is None:
+        if data is None and _wants_form(request):
             try:
                 form = await request.form()
                 p = form.get("payload")
                 if isinstance(p, str):
-                    import json as _json
-
-                    data = _json.loads(p)
+                    data = orjson.loads(p)
             except Exception:
                 pass
         # Fallback to query
@@ -432,7 +744,7 @@ async def log_event(request: Request, payload: Any = Body(None)) -> dict[str, bo
     if "ts" not in data:
         data["ts"] = datetime.now(timezone.utc).isoformat()
     try:
-        _append_jsonl("events.jsonl", data)
+        await jsonl_writer.append("events.jsonl", data)
     except Exception:
         # best-effort; surface ok anyway to not break flow
         pass
@@ -443,27 +755,24 @@ async def log_event(request: Request, payload: Any = Body(None)) -> dict[str, bo
     return {"ok": True}
 
 
-import os as _os
-import json as _json
-
-_os.makedirs(BUFFER_DIR, exist_ok=True)
-
-
-def _append_jsonl(filename: str, obj: dict) -> None:  # type: ignore[type-arg]
-    path = _os.path.join(BUFFER_DIR, filename)
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(_json.dumps(obj, ensure_ascii=False) + "\n")
-
-
 def main() -> None:
     host = os.getenv("HOST", settings.api_host)
     port = int(os.getenv("PORT", str(settings.api_port)))
+    # loop/http "auto" resolve to uvloop/httptools (uvicorn[standard] ships
+    # both) and fall back to asyncio/h11 in stripped-down environments.
+    # Lifespan state (embed_dim, batchers, clients) is per worker by design.
     uvicorn.run(
         "app.main:app",
         host=host,
         port=port,
         reload=False,
         log_level=settings.log_level.lower(),
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WORKERS", str(os.cpu_count() or 1))),
+        # Request logging already comes from the JSON access of the app's own
+        # middleware/metrics; uvicorn's per-request access log is redundant I/O
+        access_log=False,
         factory=False,
     )
 
@@ -494,15 +803,21 @@ async def hooks_slack(
     if not verify_signature(x_slack_request_timestamp, x_slack_signature, raw_body):
         slack_webhooks_invalid_total.inc()
         raise HTTPException(status_code=401, detail="invalid signature")
-    # Parse interactive payload from x-www-form-urlencoded: payload=<json>
+    # Parse interactive payload from x-www-form-urlencoded: payload=<json>.
+    # Slice the single payload= field out of the raw bytes rather than
+    # decoding and parse_qs-ing the whole body just to reach it.
     try:
-        from urllib.parse import parse_qs
-
-        form = parse_qs(raw_body.decode("utf-8"), strict_parsing=False)
-        payload_list = form.get("payload", [])
-        if not payload_list:
-            raise ValueError("missing payload")
-        event = json.loads(payload_list[0])
+        if raw_body.startswith(b"payload="):
+            start = len(b"payload=")
+        else:
+            i = raw_body.find(b"&payload=")
+            if i < 0:
+                raise ValueError("missing payload")
+            start = i + len(b"&payload=")
+        end = raw_body.find(b"&", start)
+        if end < 0:
+            end = len(raw_body)
+        event = orjson.loads(unquote_to_bytes(raw_body[start:end].replace(b"+", b" ")))
     except Exception:
         raise HTTPException(status_code=400, detail="invalid payload")
     # Quick ack via response_url if provided
@@ -515,7 +830,7 @@ async def hooks_slack(
     action = (event.get("actions") or [{}])[0]
     action_val = action.get("value")
     try:
-        parsed = json.loads(action_val) if action_val else {}
+        parsed = orjson.loads(action_val) if action_val else {}
     except Exception:
         parsed = {"action": "unknown"}
     user = (event.get("user") or {}).get("username") or (event.get("user") or {}).get("id")
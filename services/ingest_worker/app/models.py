@@ -3,7 +3,8 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import AnyHttpUrl, BaseModel
+import numpy as np
+from pydantic import AnyHttpUrl, BaseModel, field_validator
 
 
 class UrlItem(BaseModel):
@@ -29,7 +30,11 @@ class EmbedIn(BaseModel):
 
 
 class EmbedOut(BaseModel):
-    vector: list[float]
+    # Either `vector` (float, default) or `vector_int8`+`scale` (set int8=true
+    # on the request) is populated; int8 cuts a 1024-dim payload ~10x.
+    vector: list[float] | None = None
+    vector_int8: str | None = None
+    scale: float | None = None
     model: str
     ms: int
     url: AnyHttpUrl
@@ -39,9 +44,36 @@ class EmbedOut(BaseModel):
 
 class DedupIn(BaseModel):
     url: AnyHttpUrl
-    vector: list[float]
+    # Float vector, base64 float32 bytes, or base64 int8 + scale as produced
+    # by /embed?int8=true
+    vector: list[float] | None = None
+    vector_b64: str | None = None
+    vector_int8: str | None = None
+    scale: float | None = None
     payload: dict
 
+    @field_validator("vector", mode="after")
+    @classmethod
+    def _to_float32(cls, v: list[float] | None) -> np.ndarray | None:
+        # One contiguous float32 buffer: dimension check, similarity math, and
+        # wire serialization each run over it in a single pass, at a quarter
+        # of the footprint of boxed Python floats.
+        return None if v is None else np.asarray(v, dtype=np.float32)
+
+
+class EmbedBatchIn(BaseModel):
+    items: list[EmbedIn]
+
+
+class EmbedBatchOut(BaseModel):
+    vectors: list[list[float]]
+    model: str
+    ms: int
+
+
+class DedupBatchIn(BaseModel):
+    items: list[DedupIn]
+
 
 class DedupOut(BaseModel):
     is_duplicate: bool
@@ -49,6 +81,15 @@ class DedupOut(BaseModel):
     qdrant_id: str | None
 
 
+class EmbedDedupOut(BaseModel):
+    is_duplicate: bool
+    similarity: float
+    qdrant_id: str | None
+    vector_dim: int
+    model: str
+    ms: int
+
+
 class SlackNotifyIn(BaseModel):
     url: AnyHttpUrl
     title: str
@@ -8,18 +8,23 @@ class AsyncRateLimiter:
     """Simple async RPS limiter using sleep spacing.
 
     Example: rps=1.0 allows ~1 call per second across await acquire() calls.
+
+    Lock-free: each caller reserves the next send slot with a plain
+    read-modify-write on ``_last`` (atomic under the event loop — no await
+    between read and write), then sleeps until its slot. Waiters park in
+    the loop's timer heap concurrently instead of serializing through a
+    Lock, and callers arriving when the limiter is idle pay zero awaits.
     """
 
     def __init__(self, rps: float) -> None:
         self.period = 1.0 / max(0.001, rps)
         self._last: float = 0.0
-        self._lock = asyncio.Lock()
 
     async def acquire(self) -> None:
-        async with self._lock:
-            now = time.monotonic()
-            wait = max(0.0, self._last + self.period - now)
-            if wait > 0:
-                await asyncio.sleep(wait)
-            self._last = time.monotonic()
+        now = time.monotonic()
+        slot = max(self._last + self.period, now)
+        self._last = slot
+        wait = slot - now
+        if wait > 0:
+            await asyncio.sleep(wait)
 
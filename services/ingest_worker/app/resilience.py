@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import Callable, Awaitable, TypeVar
+from contextlib import contextmanager
+from typing import Callable, Awaitable, Iterator, TypeVar
 
 
 T = TypeVar("T")
@@ -22,6 +23,26 @@ class CircuitBreaker:
         self._opened_at = 0.0
         self._lock = asyncio.Lock()
 
+    def reset(self) -> None:
+        """Close the circuit and zero the failure count (tests, manual ops)."""
+        self.failures = 0
+        self.state = "CLOSED"
+        self._opened_at = 0.0
+
+    @contextmanager
+    def bypass(self) -> Iterator[None]:
+        """Temporarily run calls straight through, skipping breaker state."""
+        orig_run = self.run
+
+        async def _run(fn):
+            return await fn()
+
+        self.run = _run  # type: ignore[method-assign]
+        try:
+            yield
+        finally:
+            self.run = orig_run  # type: ignore[method-assign]
+
     async def allow(self) -> bool:
         async with self._lock:
             if self.state == "OPEN":
@@ -1,31 +1,85 @@
 from __future__ import annotations
 
+import asyncio
+import random
+import time
 from typing import Iterable, Type
 
-from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, retry_if_exception_type
+from tenacity.wait import wait_base
 
 from .config import settings
 
 
+def _sleep(seconds: float):
+    """Retry pause hook; tests monkeypatch this to skip real waiting.
+
+    Sync retries call it for its blocking side effect; async retries await
+    the asyncio.sleep it returns when a loop is running.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        time.sleep(seconds)
+        return None
+    return asyncio.sleep(seconds)
+
+
+class DecorrelatedJitter(wait_base):
+    """AWS-style decorrelated jitter: sleep = min(cap, uniform(base, prev*3)).
+
+    Unlike wait_exponential_jitter, each delay is drawn from a range anchored
+    on the previous delay, so concurrent retriers decorrelate instead of
+    clustering on the same exponential steps and re-stampeding the backend.
+    """
+
+    def __init__(self, initial: float, maximum: float) -> None:
+        self.initial = initial
+        self.maximum = maximum
+
+    def __call__(self, retry_state) -> float:  # type: ignore[override]
+        # Per-call chain state rides on the retry_state (one per invocation),
+        # so a shared decorator instance stays safe across concurrent calls
+        prev = getattr(retry_state, "_decorr_prev", self.initial)
+        delay = min(self.maximum, random.uniform(self.initial, prev * 3))
+        retry_state._decorr_prev = delay
+        return delay
+
+
+# Default decorator frozen once at import (settings snapshot): callers using
+# plain @net_retry() share it instead of rebuilding stop/wait/predicate
+# objects per application
+_DEFAULT_RETRY = retry(
+    reraise=True,
+    sleep=lambda s: _sleep(s),
+    stop=stop_after_attempt(settings.retry_max_attempts),
+    wait=DecorrelatedJitter(settings.retry_initial_delay, settings.retry_max_delay),
+    retry=retry_if_exception_type(Exception),
+)
+
+
 def net_retry(
     max_attempts: int | None = None,
     *,
     initial: float | None = None,
     maximum: float | None = None,
-    multiplier: float | None = None,  # kept for future use; tenacity jitter doesn't take multiplier directly
+    multiplier: float | None = None,  # kept for future use; jitter spread is prev*3, not a fixed multiplier
     retry_on: Iterable[Type[BaseException]] | None = None,
 ):
     """Retry decorator tuned for network I/O.
 
     Defaults are driven by settings: RETRY_MAX_ATTEMPTS, RETRY_INITIAL_DELAY, RETRY_MAX_DELAY.
     """
+    if max_attempts is None and initial is None and maximum is None and retry_on is None:
+        return _DEFAULT_RETRY
     attempts = int(max_attempts or settings.retry_max_attempts)
     init = float(initial or settings.retry_initial_delay)
     mx = float(maximum or settings.retry_max_delay)
     cond = retry_if_exception_type(tuple(retry_on) if retry_on else Exception)
     return retry(
         reraise=True,
+        sleep=lambda s: _sleep(s),
         stop=stop_after_attempt(attempts),
-        wait=wait_exponential_jitter(initial=init, max=mx),
+        wait=DecorrelatedJitter(init, mx),
         retry=cond,
     )
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+
+import numpy as np
+
+
+class SemanticCache:
+    """Short-circuit the dedup search for near-identical query vectors.
+
+    Keeps the last `maxlen` normalized query vectors with the point id each
+    was upserted under. A new query within `tau` cosine similarity of a
+    cached vector is a duplicate of that already-persisted point — tau=0.995
+    sits above both dedup similarity floors — so the endpoint can answer
+    `is_duplicate=True` without the Qdrant round-trip. Only the search is
+    skipped: callers must still persist the new point, matching the
+    always-upsert contract of `upsert_and_check`. Entries expire after
+    `ttl_seconds` for freshness.
+    """
+
+    def __init__(self, maxlen: int = 1024, tau: float = 0.995, ttl_seconds: float = 600.0) -> None:
+        self._entries: deque[tuple[np.ndarray, str, float]] = deque(maxlen=maxlen)
+        self._tau = tau
+        self._ttl = ttl_seconds
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> np.ndarray:
+        v = np.asarray(vector, dtype=np.float32)
+        n = float(np.linalg.norm(v))
+        return v / n if n else v
+
+    def lookup(self, vector: list[float]) -> tuple[float, str] | None:
+        """Return (similarity, qdrant point id) of a >=tau neighbor, or None."""
+        now = time.monotonic()
+        while self._entries and now - self._entries[0][2] > self._ttl:
+            self._entries.popleft()
+        if not self._entries:
+            return None
+        q = self._normalize(vector)
+        # One matvec over <=maxlen rows; cheap next to an embedding RTT
+        sims = np.stack([e[0] for e in self._entries]) @ q
+        i = int(np.argmax(sims))
+        if float(sims[i]) >= self._tau:
+            return float(sims[i]), self._entries[i][1]
+        return None
+
+    def add(self, vector: list[float], qid: str) -> None:
+        self._entries.append((self._normalize(vector), qid, time.monotonic()))
+
+
+# Shared instance consulted by the /dedup endpoint
+sem_cache = SemanticCache()
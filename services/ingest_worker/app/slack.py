@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import time
 from typing import Any
 
 import httpx
+import orjson
 
 from .config import settings
 from .retry import net_retry
@@ -23,21 +23,69 @@ def _secret_bytes() -> bytes:
 
 
 def _is_fresh(ts: str, tolerance_secs: int = 300) -> bool:
-    try:
-        req_ts = int(ts)
-    except Exception:
+    # String gate instead of try/except: a garbage header costs a string
+    # scan, not a ~1µs exception unwind, and valid timestamps are never
+    # signed. isascii() matters — isdigit() alone accepts Unicode digits
+    # like "²" that int() rejects
+    if not ts or not ts.isascii() or not ts.isdigit():
         return False
-    now = int(time.time())
-    return abs(now - req_ts) <= tolerance_secs
+    return abs(int(time.time()) - int(ts)) <= tolerance_secs
+
+
+# Prefer cryptography's OpenSSL-backed HMAC when installed: it routes SHA-256
+# through SHA-NI on builds where CPython's own hashlib does not. Optional, like
+# blake3/aioredis elsewhere; stdlib hmac is the fallback and gives identical
+# tags (both comparisons are constant-time).
+try:
+    from cryptography.hazmat.primitives import hashes as _crypto_hashes
+    from cryptography.hazmat.primitives import hmac as _crypto_hmac
+except Exception:  # pragma: no cover - optional dependency
+    _crypto_hashes = None
+    _crypto_hmac = None
+
+# HMAC with the key schedule already absorbed; copied per verification so the
+# secret's block processing is not redone on every webhook. Keyed by secret
+# because tests (and reconfigs) swap settings.slack_signing_secret at runtime.
+_mac_proto: tuple[bytes, Any] | None = None
+
+
+def _base_mac() -> Any:
+    global _mac_proto
+    secret = _secret_bytes()
+    if _mac_proto is None or _mac_proto[0] != secret:
+        if _crypto_hmac is not None:
+            proto = _crypto_hmac.HMAC(secret, _crypto_hashes.SHA256())
+        else:
+            proto = hmac.new(secret, digestmod=hashlib.sha256)
+        _mac_proto = (secret, proto)
+    return _mac_proto[1].copy()
 
 
 def verify_signature(ts: str, sig: str, body: bytes) -> bool:
+    # Freshness first: stale requests are shed before any HMAC work
     if not _is_fresh(ts):
         return False
-    base = f"v0:{ts}:{body.decode('utf-8')}".encode("utf-8")
-    digest = hmac.new(_secret_bytes(), base, hashlib.sha256).hexdigest()
-    expected = f"v0={digest}"
-    return hmac.compare_digest(expected, sig)
+    # Decode the claimed signature to raw bytes up front: comparing digests
+    # as bytes skips hex-encoding our side, and a malformed header bails
+    # before any HMAC work.
+    if not sig.startswith("v0="):
+        return False
+    try:
+        sig_bytes = bytes.fromhex(sig[3:])
+    except ValueError:
+        return False
+    m = _base_mac()
+    m.update(f"v0:{ts}:".encode("utf-8"))
+    m.update(body)  # exact raw bytes; no decode/re-encode round-trip
+    if _crypto_hmac is not None:
+        from cryptography.exceptions import InvalidSignature
+
+        try:
+            m.verify(sig_bytes)
+            return True
+        except InvalidSignature:
+            return False
+    return hmac.compare_digest(sig_bytes, m.digest())
 
 
 _slack_cb = CircuitBreaker(failure_threshold=3, recovery_time=10.0)
@@ -60,7 +108,9 @@ async def send_message(text: str, blocks: list[dict[str, Any]] | None = None) ->
         payload["blocks"] = blocks
     async def _do() -> dict[str, Any]:
         async with async_http_client(timeout=10.0) as client:
-            r = await client.post(url, headers=headers, json=payload)
+            # Pre-encoded body: orjson beats httpx's stdlib json= path and
+            # the Content-Type header is already set above
+            r = await client.post(url, headers=headers, content=orjson.dumps(payload))
             r.raise_for_status()
             data = r.json()
             if not data.get("ok"):
@@ -72,10 +122,19 @@ async def send_message(text: str, blocks: list[dict[str, Any]] | None = None) ->
 
 async def respond(response_url: str, text: str) -> None:
     async with async_http_client(timeout=10.0) as client:
-        await client.post(response_url, json={"text": text, "replace_original": False})
+        await client.post(
+            response_url,
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            content=orjson.dumps({"text": text, "replace_original": False}),
+        )
 
 
 def action_blocks(url: str, title: str, similarity: float) -> list[dict[str, Any]]:
+    # Fixed-shape button values: encode only the url (which needs escaping)
+    # and splice it into the template instead of dumping a dict per button
+    url_json = orjson.dumps(url).decode()
+    approve_value = '{"action":"approve","url":' + url_json + "}"
+    reject_value = '{"action":"reject","url":' + url_json + "}"
     return [
         {
             "type": "section",
@@ -93,14 +152,14 @@ def action_blocks(url: str, title: str, similarity: float) -> list[dict[str, Any
                     "action_id": "phishradar_approve",
                     "text": {"type": "plain_text", "text": "Approve"},
                     "style": "primary",
-                    "value": json.dumps({"action": "approve", "url": url}),
+                    "value": approve_value,
                 },
                 {
                     "type": "button",
                     "action_id": "phishradar_reject",
                     "text": {"type": "plain_text", "text": "Reject"},
                     "style": "danger",
-                    "value": json.dumps({"action": "reject", "url": url}),
+                    "value": reject_value,
                 },
             ],
         },
@@ -144,7 +203,7 @@ async def start_socket_mode() -> None:
                 payload = req.payload  # interactive payload dict
                 action = (payload.get("actions") or [{}])[0]
                 val = action.get("value")
-                parsed = json.loads(val) if val else {}
+                parsed = orjson.loads(val) if val else {}
                 resp_url = payload.get("response_url")
                 user = (payload.get("user") or {}).get("username") or (payload.get("user") or {}).get("id")
                 # Optional quick ack to response_url
@@ -1,5 +1,8 @@
 import os
 import sys
+from types import SimpleNamespace
+
+import pytest
 
 # Ensure tests can import `app` when running from different cwd
 THIS_DIR = os.path.dirname(__file__)
@@ -7,3 +10,56 @@ PROJECT_ROOT = os.path.abspath(os.path.join(THIS_DIR, '..'))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+
+@pytest.fixture
+def ram_tmp_path(tmp_path):
+    """tmp_path, but on /dev/shm when available so queue I/O never touches
+    disk (CI runners often sit on slow attached storage)."""
+    import shutil
+    import tempfile
+
+    if not os.path.isdir("/dev/shm"):
+        yield tmp_path
+        return
+    path = tempfile.mkdtemp(prefix="pytest-phishradar-", dir="/dev/shm")
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def portal():
+    """Long-lived loop for sync tests: portal.call(coro_fn, ...) submits to
+    one session loop instead of paying asyncio.run setup/teardown per call."""
+    import anyio.from_thread
+
+    with anyio.from_thread.start_blocking_portal() as p:
+        yield p
+
+
+@pytest.fixture(scope="session")
+def asgi_transport():
+    """Session-wide ASGI transport: the FastAPI router build and transport
+    construction are paid once, not per test call."""
+    import httpx
+
+    from app.main import app
+
+    return httpx.ASGITransport(app=app)
+
+
+@pytest.fixture
+def fake_collection():
+    """Factory for the get_collection response shape the store reads
+    (config.params.vectors.size); shared by the Qdrant test modules."""
+
+    def make(vector_size: int):
+        return SimpleNamespace(
+            config=SimpleNamespace(
+                params=SimpleNamespace(vectors=SimpleNamespace(size=vector_size))
+            )
+        )
+
+    return make
+
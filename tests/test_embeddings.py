@@ -1,4 +1,3 @@
-import asyncio
 import os
 
 import httpx
@@ -17,6 +16,6 @@ async def _probe_dim() -> int:
 
 
 @pytest.mark.skipif(os.getenv("PHISHRADAR_EMBED_TESTS") != "1", reason="Embed integration test disabled by default")
-def test_embedding_length_and_latency():
-    dim = asyncio.run(_probe_dim())
+def test_embedding_length_and_latency(portal):
+    dim = portal.call(_probe_dim)
     assert dim > 100
@@ -1,17 +1,13 @@
-import importlib
 import pytest
 
+from services.ingest_worker.app.ingest_queue import FileIngestQueue
+
 
 @pytest.mark.asyncio
-async def test_ingest_queue_push_and_fetch(tmp_path, monkeypatch):
-    monkeypatch.setenv("BUFFER_DIR", str(tmp_path))
-    # Reload modules to pick up new BUFFER_DIR
-    paths_mod = importlib.import_module("services.ingest_worker.app.paths")
-    importlib.reload(paths_mod)
-    iq_mod = importlib.import_module("services.ingest_worker.app.ingest_queue")
-    importlib.reload(iq_mod)
-    IngestQueue = iq_mod.IngestQueue
-    q = IngestQueue()
+async def test_ingest_queue_push_and_fetch(ram_tmp_path):
+    # Pin the file backend: the auto wrapper prefers Redis when one is
+    # reachable, and buffer_dir only steers the file-backed queue
+    q = FileIngestQueue(buffer_dir=ram_tmp_path)
     row1 = {"url": "https://a/1", "domain": "a", "ts": "0"}
     row2 = {"url": "https://a/2", "domain": "a", "ts": "1"}
     await q.push(row1)
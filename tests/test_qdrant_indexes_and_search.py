@@ -1,5 +1,9 @@
 import types
+from collections import Counter
+from unittest.mock import MagicMock
+
 import pytest
+from qdrant_client import AsyncQdrantClient
 
 from app.qdrant_client import QdrantStore
 
@@ -11,32 +15,37 @@ class FakePoint:
         self.payload = payload
 
 
-@pytest.mark.asyncio
-async def test_qdrant_ensure_payload_indexes(monkeypatch):
-    store = QdrantStore()
-    called = {"domain": 0, "ts": 0}
-
-    def fake_create_index(**kwargs):  # type: ignore[no-redef]
-        field = kwargs.get("field_name")
-        if field == "domain":
-            called["domain"] += 1
-        elif field == "ts":
-            called["ts"] += 1
-        return None
-
-    monkeypatch.setattr(store.client, "create_payload_index", fake_create_index)
-    await store.ensure_payload_indexes()
-    assert called["domain"] == 1 and called["ts"] == 1
+# One store for the whole module; each test swaps in a spec'd client mock
+# (monkeypatch auto-reverts) instead of stubbing methods one by one
+@pytest.fixture(scope="module")
+def store():
+    return QdrantStore()
 
 
-@pytest.mark.asyncio
-async def test_qdrant_search_wrappers(monkeypatch):
-    store = QdrantStore()
+@pytest.fixture
+def client(store, monkeypatch):
+    mock = MagicMock(spec=AsyncQdrantClient)
+    monkeypatch.setattr(store, "client", mock)
+    return mock
 
-    def fake_search(**kwargs):  # type: ignore[no-redef]
-        return [FakePoint("id1", 0.9, {"domain": "example.com"})]
 
-    monkeypatch.setattr(store.client, "search", fake_search)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_qdrant_ensure_payload_indexes(store, client):
+    client.create_payload_index.return_value = None
+    await store.ensure_payload_indexes()
+    called = Counter(
+        c.kwargs["field_name"] for c in client.create_payload_index.call_args_list
+    )
+    assert called == Counter(domain=1, ts=1)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_qdrant_search_wrappers(store, client):
+    # Both wrappers coalesce into one query_batch_points RPC; stub the
+    # response a single-request flush returns
+    client.query_batch_points.return_value = [
+        types.SimpleNamespace(points=[FakePoint("id1", 0.9, {"domain": "example.com"})])
+    ]
     out = await store.search([0.0, 0.1, 0.2])
     assert out and out[0][0] == "id1" and abs(out[0][1] - 0.9) < 1e-6
 
@@ -44,38 +53,10 @@ async def test_qdrant_search_wrappers(monkeypatch):
     assert out2 and out2[0][2]["domain"] == "example.com"
 
 
-@pytest.mark.asyncio
-async def test_qdrant_ensure_collection_no_recreate(monkeypatch):
-    store = QdrantStore()
-    deleted = {"yes": False, "recreated": False}
-
-    class _Col:
-        class _Cfg:
-            class _Params:
-                class _Vec:
-                    size = 256
-
-                vectors = _Vec()
-
-            params = _Params()
-
-        config = _Cfg()
-
-    def fake_get_collection(name):  # type: ignore[no-redef]
-        return _Col()
-
-    def fake_delete(name):  # type: ignore[no-redef]
-        deleted["yes"] = True
-        return None
-
-    def fake_recreate(**kwargs):  # type: ignore[no-redef]
-        deleted["recreated"] = True
-        return None
-
-    monkeypatch.setattr(store.client, "get_collection", fake_get_collection)
-    monkeypatch.setattr(store.client, "delete_collection", fake_delete)
-    monkeypatch.setattr(store.client, "recreate_collection", fake_recreate)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_qdrant_ensure_collection_no_recreate(store, client, fake_collection):
+    client.get_collection.return_value = fake_collection(256)
 
     await store.ensure_collection(vector_size=256)
-    assert not deleted["yes"] and not deleted["recreated"]
-
+    assert not client.delete_collection.called
+    assert not client.recreate_collection.called
@@ -1,61 +1,49 @@
 import asyncio
 import types
+from unittest.mock import MagicMock
 
 import pytest
+from qdrant_client import AsyncQdrantClient
 
 from app.qdrant_client import QdrantStore
 
 
-@pytest.mark.asyncio
-async def test_upsert_retries_then_succeeds(monkeypatch):
+def _mock_store() -> QdrantStore:
     store = QdrantStore()
-    calls = {"n": 0}
+    store.client = MagicMock(spec=AsyncQdrantClient)
+    return store
 
-    def fake_upsert(**kwargs):  # type: ignore[no-redef]
-        calls["n"] += 1
-        if calls["n"] == 1:
-            raise RuntimeError("transient")
-        return None
 
-    monkeypatch.setattr(store.client, "upsert", fake_upsert)
+@pytest.mark.asyncio
+async def test_upsert_retries_then_succeeds():
+    store = _mock_store()
+    store.client.upsert.side_effect = [RuntimeError("transient"), None]
     pid = await store.upsert("https://example.com/a", [0.0, 0.1, 0.2], {"domain": "example.com"})
     assert isinstance(pid, str)
-    assert calls["n"] == 2
-
-
-class _Col:
-    class _Cfg:
-        class _Params:
-            class _Vec:
-                size = 123
-
-            vectors = _Vec()
-
-        params = _Params()
-
-    config = _Cfg()
+    assert store.client.upsert.call_count == 2
 
 
 @pytest.mark.asyncio
-async def test_ensure_collection_recreate_on_mismatch(monkeypatch):
-    store = QdrantStore()
-    got = {"deleted": False, "recreated": False}
-
-    def fake_get_collection(name):  # type: ignore[no-redef]
-        return _Col()
+async def test_upsert_many_single_call():
+    store = _mock_store()
+    store.client.upsert.return_value = None
+    items = [
+        (f"https://example.com/{i}", [0.0, 0.1, 0.2], {"domain": "example.com"})
+        for i in range(5)
+    ]
+    ids = await store.upsert_many(items)
+    assert len(ids) == 5
+    # Batch boundary: one RPC for the whole batch, not one per point
+    assert store.client.upsert.call_count == 1
 
-    def fake_delete(name):  # type: ignore[no-redef]
-        got["deleted"] = True
-        return None
 
-    def fake_recreate(**kwargs):  # type: ignore[no-redef]
-        got["recreated"] = True
-        return None
-
-    monkeypatch.setattr(store.client, "get_collection", fake_get_collection)
-    monkeypatch.setattr(store.client, "delete_collection", fake_delete)
-    monkeypatch.setattr(store.client, "recreate_collection", fake_recreate)
+@pytest.mark.asyncio
+async def test_ensure_collection_recreate_on_mismatch(fake_collection):
+    store = _mock_store()
+    store.client.get_collection.return_value = fake_collection(123)
+    store.client.delete_collection.return_value = None
+    store.client.recreate_collection.return_value = None
 
     await store.ensure_collection(vector_size=256)
-    assert got["deleted"]
-    assert got["recreated"]
+    assert store.client.delete_collection.called
+    assert store.client.recreate_collection.called
@@ -1,9 +1,10 @@
-import time
-
+from services.ingest_worker.app import retry as retry_mod
 from app.retry import net_retry
 
 
-def test_net_retry_retries_then_succeeds():
+def test_net_retry_retries_then_succeeds(monkeypatch):
+    # Skip real backoff sleeps; the call count is the behavior under test
+    monkeypatch.setattr(retry_mod, "_sleep", lambda s: None)
     calls = {"n": 0}
 
     @net_retry(max_attempts=3, initial=0.01, maximum=0.02)
@@ -13,10 +14,6 @@ def test_net_retry_retries_then_succeeds():
             raise RuntimeError("transient")
         return 42
 
-    t0 = time.perf_counter()
     out = sometimes_fails()
     assert out == 42
     assert calls["n"] == 2
-    # ensure we actually waited a little between attempts (loose bound)
-    assert (time.perf_counter() - t0) >= 0.0
-
@@ -18,7 +18,7 @@ class DummyClient:
     async def __aexit__(self, exc_type, exc, tb):
         return False
 
-    async def post(self, url, headers=None, json=None):  # noqa: A002 - shadowing json name acceptable in test
+    async def post(self, url, headers=None, json=None, content=None):  # noqa: A002 - shadowing json name acceptable in test
         return DummyResp()
 
 
@@ -27,19 +27,16 @@ async def test_send_message_success(monkeypatch):
     # Configure tokens
     slack_mod.settings.slack_bot_token = "xoxb-test"
     slack_mod.settings.slack_channel_id = "C123"
-    # Reset circuit breaker in case other tests opened it
     # Patch the original module (re-exported by app.slack)
     import importlib
     orig = importlib.import_module("services.ingest_worker.app.slack")
-    # Use a fresh circuit breaker to avoid OPEN state from previous tests
-    orig._slack_cb = orig.CircuitBreaker(failure_threshold=100, recovery_time=0.01)  # type: ignore[attr-defined]
-    async def _run(fn):
-        return await fn()
-    # Bypass breaker behavior for this success test
-    monkeypatch.setattr(orig._slack_cb, "run", _run)  # type: ignore[attr-defined]
+    # Close the breaker in case other tests opened it, then bypass it for
+    # this success test
+    orig._slack_cb.reset()  # type: ignore[attr-defined]
     # Patch HTTP client to dummy
     monkeypatch.setattr(orig, "async_http_client", lambda timeout=10.0: DummyClient())
-    data = await slack_mod.send_message("hello", blocks=None)
+    with orig._slack_cb.bypass():  # type: ignore[attr-defined]
+        data = await slack_mod.send_message("hello", blocks=None)
     assert data["ok"] is True and data["channel"] == "C"
 
 